@@ -40,9 +40,15 @@ from .udg.codec import Codec  # noqa: F401
 from .udg.folder import Folder  # noqa: F401
 from .udg.keyed import Keyed  # noqa: F401
 from .udg.node import Node  # noqa: F401
+from .udg.pool import Budget, Pool  # noqa: F401
+from .udg.tablecache import TableCache  # noqa: F401
 from .udg.tabular import Tabular  # noqa: F401
-from .udg.verifiable import Verifiable, VerifyDict  # noqa: F401
+from .udg.verifiable import Verifiable, VerifyDict, VerifyingReader  # noqa: F401
+from .config.blobstore import BlobStore  # noqa: F401
 from .config.config import Config  # noqa: F401
 from .config.data import Data  # noqa: F401
+from .config.hashcache import HashCache  # noqa: F401
+from .config.sortedindex import SortedIndex  # noqa: F401
 from .config.spec import Spec  # noqa: F401
 from .config.udi import UDI  # noqa: F401
+from .config.versionlog import VersionLog  # noqa: F401
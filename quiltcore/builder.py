@@ -1,4 +1,7 @@
+import pyarrow as pa  # type: ignore
+
 from .udg.header import Header
+from .udg.tabular import Tabular
 from .udg.node import Node
 from .udg.folder import Folder
 from .udg.verifiable import VerifyDict
@@ -14,11 +17,20 @@ class FolderBuilder(Folder):
     def __init__(self, path: Path, parent: Node, **kwargs):
         super().__init__(path.name, parent, **kwargs)
         self.path = path
+        self.hash_cache = getattr(parent, "hash_cache", None)
         self.header: Header | None = None
         self.body4: list | None = None
 
     def update(self):
-        self.body4 = self.to_list4(self.path)
+        body4 = self.to_list4(self.path)
+        if self.sort_by_name():
+            body4.sort(key=lambda dict4: dict4.name)
+        self.body4 = body4
+
+    def sort_by_name(self) -> bool:
+        """Sort entries by name (before hashing), per `tabular/sort_by_name`."""
+        default = self.cf.get_dict("tabular").get(Tabular.K_SORT, False)
+        return bool(self.args.get(Tabular.K_SORT, default))
 
     def list4(self) -> List4:
         """Return a list4 of the manifest."""
@@ -35,6 +47,16 @@ class FolderBuilder(Folder):
             hashable += self.q3hash_from_hash(dict4.multihash)
         return hashable.encode("utf-8")
 
+    def _multihash_contents(self) -> Multihash:
+        """Top hash: same bytes as `to_bytes`, built from a multihash column."""
+        assert isinstance(self.body4, list)
+        assert isinstance(self.header, Header)
+        header_dict = VerifyDict(self.cf, self.header.hashable_dict())
+        multihashes = pa.array([dict4.multihash for dict4 in self.body4], pa.string())
+        values = self.cf.hash_value_column(multihashes)
+        head = header_dict.q3hash().encode("utf-8")
+        return self.cf.digest_strings(head, values).hex()
+
     def commit(self, message: str = "Updated", user_meta: dict = {}) -> Multihash:
         """Commit the changes to the manifest."""
         assert isinstance(self.parent, Node)
@@ -0,0 +1,185 @@
+import logging
+import os
+import shutil
+import sys
+
+from pathlib import Path
+from typing import BinaryIO, Callable
+from uuid import uuid4
+
+
+class BlobStore:
+    """
+    Local content-addressed store of file contents, keyed by multihash.
+
+    Each blob is verified against its multihash, written once, made
+    read-only, and then installed into package folders by reflink
+    (copy-on-write), so repeated versions of a package share the same
+    bytes on disk. The store is only worth using if `uses_links` is
+    True; otherwise every file would be stored twice.
+
+    NOTE: `hardlink` must be requested explicitly: hardlinked files share
+    the (read-only) blob's inode, so editing one in place would change
+    the blob for every version that uses it.
+    """
+
+    FICLONE = 0x40049409  # Linux ioctl: _IOW(0x94, 9, int)
+    FANOUT = 2
+    READ_ONLY = 0o444
+    TMP_DIR = "tmp"
+    K_COPY = "copy"
+    K_HARDLINK = "hardlink"
+    K_REFLINK = "reflink"
+
+    @classmethod
+    def Reflink(cls, src: Path, dest: Path) -> None:
+        """Clone src into dest, sharing extents (btrfs, xfs, ...)."""
+        if not sys.platform.startswith("linux"):
+            raise OSError(f"reflink unsupported on {sys.platform}")
+        import fcntl
+
+        with open(src, "rb") as fi, open(dest, "wb") as fo:
+            fcntl.ioctl(fo.fileno(), cls.FICLONE, fi.fileno())
+
+    @staticmethod
+    def Hardlink(src: Path, dest: Path) -> None:
+        os.link(src, dest)
+
+    @staticmethod
+    def Copy(src: Path, dest: Path) -> None:
+        """
+        Copy a local file inside the kernel where possible.
+
+        Uses copy_file_range (which may share extents), falling back
+        to shutil.copyfile (sendfile on Linux, fcopyfile on macOS).
+        """
+        copy_range = getattr(os, "copy_file_range", None)
+        if copy_range is not None:
+            with open(src, "rb") as fi, open(dest, "wb") as fo:
+                remaining = os.fstat(fi.fileno()).st_size
+                try:
+                    while remaining > 0:
+                        copied = copy_range(fi.fileno(), fo.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                    if remaining == 0:
+                        return
+                except OSError as e:
+                    logging.debug(f"BlobStore.Copy.copy_file_range[{src}]: {e}")
+        shutil.copyfile(src, dest)
+
+    def __init__(self, dir: Path, digest: Callable[[Path], bytes]) -> None:
+        self.dir = dir
+        self.digest = digest
+        self._can_reflink: bool | None = None
+        self.linkers: dict[str, Callable[[Path, Path], None]] = {
+            self.K_REFLINK: self.Reflink,
+            self.K_HARDLINK: self.Hardlink,
+            self.K_COPY: self.Copy,
+        }
+
+    def __repr__(self) -> str:
+        return f"BlobStore({self.dir})"
+
+    def __contains__(self, multihash: str) -> bool:
+        return self.path(multihash).exists()
+
+    def can_reflink(self) -> bool:
+        """Probe (once) whether the store's filesystem supports reflinks."""
+        if self._can_reflink is None:
+            src = self.temp_path()
+            dest = src.with_name(f"{src.name}.{self.K_REFLINK}")
+            try:
+                src.write_bytes(b"reflink")
+                self.Reflink(src, dest)
+                self._can_reflink = True
+            except OSError as e:
+                logging.debug(f"BlobStore.can_reflink[{self.dir}]: {e}")
+                self._can_reflink = False
+            finally:
+                src.unlink(missing_ok=True)
+                dest.unlink(missing_ok=True)
+        return self._can_reflink
+
+    def uses_links(self, links: list[str]) -> bool:
+        """True if installing via links would share blobs rather than copy them."""
+        if self.K_HARDLINK in links:
+            return True
+        return self.K_REFLINK in links and self.can_reflink()
+
+    def get(self, multihash: str, size: int | None = None) -> Path | None:
+        """Return the blob path if present (and of the expected size)."""
+        blob = self.path(multihash)
+        try:
+            stat = blob.stat()
+        except OSError:
+            return None
+        if size is not None and stat.st_size != size:
+            logging.warning(f"BlobStore.size_mismatch[{blob}]: {stat.st_size} {size}")
+            return None
+        return blob
+
+    def path(self, multihash: str) -> Path:
+        """Blob location, fanned out by the last characters of the digest."""
+        start = len(multihash) - self.FANOUT
+        return self.dir / multihash[start:] / multihash
+
+    def temp_path(self) -> Path:
+        tmp_dir = self.dir / self.TMP_DIR
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        return tmp_dir / uuid4().hex
+
+    def commit(self, tmp: Path, multihash: str, verified: bool = False) -> Path:
+        """
+        Move a fully-written temp file into the store as a read-only blob,
+        after checking its contents against multihash (unless `verified`).
+        """
+        if not verified:
+            digest = self.digest(tmp).hex()
+            if digest != multihash:
+                raise ValueError(f"BlobStore.mismatch[{multihash}]: {digest}")
+        blob = self.path(multihash)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        os.chmod(tmp, self.READ_ONLY)
+        os.replace(tmp, blob)
+        return blob
+
+    def add(self, multihash: str, source: BinaryIO | Path, block_size: int = 0) -> Path:
+        """Write (verified) source into the store, replacing any existing blob."""
+        tmp = self.temp_path()
+        try:
+            if isinstance(source, Path):
+                self.Copy(source, tmp)
+            else:
+                with tmp.open("wb") as fo:
+                    shutil.copyfileobj(source, fo, block_size or shutil.COPY_BUFSIZE)
+            return self.commit(tmp, multihash)
+        finally:
+            tmp.unlink(missing_ok=True)
+
+    def is_installed(self, multihash: str, dest: Path) -> bool:
+        """True if dest is a hardlink to the blob."""
+        try:
+            return os.path.samefile(self.path(multihash), dest)
+        except OSError:
+            return False
+
+    def install(self, multihash: str, dest: Path, links: list[str]) -> str:
+        """
+        Place the blob at dest using the first link method that works.
+
+        Returns the method used; dest is replaced atomically.
+        """
+        blob = self.path(multihash)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_name(f".{dest.name}.{uuid4().hex}")
+        for link in links:
+            try:
+                self.linkers[link](blob, tmp)
+                os.replace(tmp, dest)
+                return link
+            except OSError as e:
+                logging.debug(f"BlobStore.install.{link}[{dest}]: {e}")
+                tmp.unlink(missing_ok=True)
+        raise OSError(f"BlobStore.install failed for {dest} via {links}")
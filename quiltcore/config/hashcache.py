@@ -0,0 +1,113 @@
+import json
+import logging
+
+from collections import OrderedDict
+from os import stat_result
+from pathlib import Path
+from threading import Lock
+from time import time_ns
+from typing import Callable
+
+
+class HashCache:
+    """
+    Persistent, size-bounded LRU cache of file multihashes.
+
+    Entries are keyed by (path, size, mtime_ns, inode), so any change
+    to a file invalidates its entry. Only local files are cached.
+    """
+
+    CACHE_FILE = "hashes.json"
+    DEFAULT_SIZE = 100_000
+    K_ENTRIES = "entries"
+    K_VERSION = "version"
+    VERSION = 1
+    # Files modified this recently may change again within the same mtime tick
+    RACY_NS = 2_000_000_000
+
+    @staticmethod
+    def StatKey(path: Path) -> str | None:
+        """Return the cache key for a local file, or None if uncacheable."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        if not isinstance(stat, stat_result):
+            return None
+        if time_ns() - stat.st_mtime_ns < HashCache.RACY_NS:
+            return None
+        return f"{path}|{stat.st_size}|{stat.st_mtime_ns}|{stat.st_ino}"
+
+    def __init__(self, dir: Path, max_size: int = DEFAULT_SIZE) -> None:
+        self.path = dir / self.CACHE_FILE
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, str] | None = None
+        self._dirty = False
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        return f"HashCache({self.path}, hits={self.hits}, misses={self.misses})"
+
+    def __len__(self) -> int:
+        return len(self.entries())
+
+    def entries(self) -> OrderedDict[str, str]:
+        """Load entries (least recently used first) on first access."""
+        if self._entries is None:
+            self._entries = OrderedDict()
+            if self.path.exists():
+                try:
+                    data = json.loads(self.path.read_text())
+                    if data.get(self.K_VERSION) == self.VERSION:
+                        self._entries.update(data[self.K_ENTRIES])
+                except (ValueError, KeyError, TypeError) as e:
+                    logging.warning(f"HashCache.ignoring[{self.path}]: {e}")
+        return self._entries
+
+    def get(self, key: str | None) -> bytes | None:
+        """Return the raw multihash for key, marking it recently used."""
+        if key is None:
+            return None
+        with self._lock:
+            entries = self.entries()
+            value = entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            entries.move_to_end(key)
+            self.hits += 1
+            return bytes.fromhex(value)
+
+    def put(self, key: str | None, raw_hash: bytes) -> None:
+        """Store the raw multihash for key, evicting the oldest entries."""
+        if key is None:
+            return
+        with self._lock:
+            entries = self.entries()
+            entries[key] = raw_hash.hex()
+            entries.move_to_end(key)
+            while len(entries) > self.max_size:
+                entries.popitem(last=False)
+            self._dirty = True
+
+    def digest(self, path: Path, digest_path: Callable[[Path], bytes]) -> bytes:
+        """Return the cached multihash of path, computing and caching on a miss."""
+        key = self.StatKey(path)
+        raw_hash = self.get(key)
+        if raw_hash is None:
+            raw_hash = digest_path(path)
+            if self.StatKey(path) == key:
+                self.put(key, raw_hash)
+        return raw_hash
+
+    def save(self) -> None:
+        """Write entries to disk if anything changed."""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            data = {self.K_VERSION: self.VERSION, self.K_ENTRIES: self._entries}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(data, separators=(",", ":")))
+            self._dirty = False
@@ -0,0 +1,68 @@
+import os
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore
+
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
+from typing import Iterator
+from uuid import uuid4
+
+from ..udg.types import Types
+
+
+class LockedFile:
+    """
+    Small file updated under a lock shared by every instance for the
+    same path (and, for local paths, an exclusive `flock` on a sibling
+    `.lock` file, across processes), then rewritten atomically.
+    """
+
+    LOCK_SUFFIX = ".lock"
+    _locks: dict[str, Lock] = {}
+    _locks_lock = Lock()
+
+    @classmethod
+    def PathLock(cls, path: Path) -> Lock:
+        """Return the in-process lock for path, shared by all instances."""
+        with cls._locks_lock:
+            return cls._locks.setdefault(str(path), Lock())
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = self.PathLock(path)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.path})"
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Hold this file's lock (across processes, for local paths)."""
+        with self._lock:
+            if fcntl is None or not Types.IsLocalPath(self.path):
+                yield
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            lock_path = self.path.with_name(self.path.name + self.LOCK_SUFFIX)
+            with open(Types.OsPath(lock_path), "a") as fl:
+                fcntl.flock(fl, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(fl, fcntl.LOCK_UN)
+
+    def write_atomic(self, text: str) -> None:
+        """Replace the file's contents (atomically, for local paths)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if not Types.IsLocalPath(self.path):
+            self.path.write_text(text)
+            return
+        tmp = self.path.with_name(f".{self.path.name}.{uuid4().hex}")
+        tmp.write_text(text)
+        os.replace(Types.OsPath(tmp), Types.OsPath(self.path))
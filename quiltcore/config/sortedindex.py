@@ -0,0 +1,75 @@
+import logging
+
+from bisect import bisect_left, insort
+from typing import Callable
+
+from .lockedfile import LockedFile
+
+
+class SortedIndex(LockedFile):
+    """
+    Small on-disk index of `key value` lines, kept sorted by key.
+
+    Lookups read the file once and binary-search it, so resolving a
+    key prefix does not require listing the underlying directory.
+    Updates are read-modify-write cycles under the path's `locked()`,
+    then rewrite the file atomically.
+    """
+
+    SEP = " "
+
+    def read(self) -> list[tuple[str, str]]:
+        """Return all (key, value) pairs in key order."""
+        if not self.path.exists():
+            return []
+        pairs = []
+        for line in self.path.read_text().splitlines():
+            if line:
+                key, _, value = line.partition(self.SEP)
+                pairs.append((key, value))
+        return pairs
+
+    def get(self, key: str) -> str | None:
+        pairs = self.read()
+        i = bisect_left(pairs, (key,))
+        if i < len(pairs) and pairs[i][0] == key:
+            return pairs[i][1]
+        return None
+
+    def prefix(self, prefix: str) -> list[tuple[str, str]]:
+        """Return every (key, value) whose key starts with prefix."""
+        pairs = self.read()
+        i = bisect_left(pairs, (prefix,))
+        matches = []
+        while i < len(pairs) and pairs[i][0].startswith(prefix):
+            matches.append(pairs[i])
+            i += 1
+        return matches
+
+    def ensure(self, build: Callable[[], list[tuple[str, str]]]) -> None:
+        """Create the index from `build()` if it does not exist yet."""
+        if self.path.exists():
+            return
+        with self.locked():
+            if not self.path.exists():
+                self._write(sorted(build()))
+
+    def put(self, key: str, value: str = "") -> None:
+        """Insert or replace key, keeping the file sorted."""
+        if self.SEP in key or "\n" in key + value:
+            raise ValueError(f"SortedIndex.invalid_key: {key!r} {value!r}")
+        with self.locked():
+            pairs = self.read()
+            i = bisect_left(pairs, (key,))
+            if i < len(pairs) and pairs[i][0] == key:
+                if pairs[i][1] == value:
+                    return
+                pairs[i] = (key, value)
+            else:
+                insort(pairs, (key, value))
+            self._write(pairs)
+
+    def _write(self, pairs: list[tuple[str, str]]) -> None:
+        text = "".join(f"{key}{self.SEP}{value}\n" for key, value in pairs)
+        self.write_atomic(text)
+        logging.debug(f"SortedIndex.write[{len(pairs)}]: {self.path}")
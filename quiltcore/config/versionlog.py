@@ -0,0 +1,86 @@
+import logging
+
+from datetime import datetime
+
+from ..udg.types import Types
+from .lockedfile import LockedFile
+
+Since = int | str | datetime | None
+
+
+class VersionLog(LockedFile):
+    """
+    Append-only log of `timestamp hash` lines, one per tagged version.
+
+    Versions are appended in time order, so time-range and
+    most-recent queries need only a single read of the file.
+    Writes hold the path's `locked()`; object stores cannot append,
+    so there an append is a read-modify-write that is only locked
+    within this process.
+    """
+
+    SEP = " "
+
+    @staticmethod
+    def AsTime(value: Since) -> int | None:
+        """Convert a tag, epoch seconds, or datetime to epoch seconds."""
+        if value is None:
+            return None
+        if isinstance(value, datetime):
+            return int(value.timestamp())
+        return int(value)
+
+    def read(self) -> list[tuple[int, str]]:
+        """Return every (timestamp, hash) entry in log order."""
+        if not self.path.exists():
+            return []
+        entries = []
+        for line in self.path.read_text().splitlines():
+            tag, _, hash = line.partition(self.SEP)
+            if tag.isdigit() and hash:
+                entries.append((int(tag), hash))
+            elif line:
+                logging.warning(f"VersionLog.skipping[{self.path}]: {line}")
+        return entries
+
+    def append(self, tag: str, hash: str) -> None:
+        line = f"{tag}{self.SEP}{hash}\n"
+        with self.locked():
+            if Types.IsLocalPath(self.path):
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(Types.OsPath(self.path), "a") as fo:
+                    fo.write(line)
+            else:  # object stores cannot append
+                text = self.path.read_text() if self.path.exists() else ""
+                self.write_atomic(text + line)
+
+    def rebuild(self, entries: list[tuple[int, str]]) -> None:
+        """Replace the log with entries, sorted by time."""
+        with self.locked():
+            self._write(entries)
+
+    def merge(self, entries: list[tuple[int, str]]) -> None:
+        """Add any entries missing from the log, then re-sort it by time."""
+        with self.locked():
+            current = self.read()
+            missing = set(entries) - set(current)
+            if missing:
+                self._write(current + sorted(missing))
+
+    def _write(self, entries: list[tuple[int, str]]) -> None:
+        ordered = sorted(entries, key=lambda entry: entry[0])  # stable for ties
+        self.write_atomic("".join(f"{tag}{self.SEP}{hash}\n" for tag, hash in ordered))
+
+    def query(
+        self, since: Since = None, until: Since = None, limit: int = 0
+    ) -> list[tuple[int, str]]:
+        """Return entries in [since, until], newest first, at most `limit`."""
+        start, end = self.AsTime(since), self.AsTime(until)
+        entries = [
+            (tag, hash)
+            for tag, hash in self.read()
+            if (start is None or tag >= start) and (end is None or tag <= end)
+        ]
+        entries.reverse()  # latest appended first among equal timestamps
+        entries.sort(key=lambda entry: entry[0], reverse=True)
+        return entries[:limit] if limit > 0 else entries
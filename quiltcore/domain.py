@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import logging
 import os
@@ -10,15 +11,19 @@ from .factory import quilt
 from .manifest import Manifest
 from .udg.folder import Folder
 from .udg.node import Node
+from .config.blobstore import BlobStore
 from .config.data import Data
+from .config.hashcache import HashCache
 from .config.udi import UDI
 
 
 class Domain(Folder):
+    K_CACHE_SIZE = "cache_size"
     K_MUTABLE = "mutable"
     K_NOCOPY = "no_copy"
     K_NEWOK = "new_ok"
     K_PACKAGE = "package"
+    K_RELAX = "relax"
     K_REMOTE = "remote"
     TAG_DEFAULT = "latest"
     URI_SPLIT = "://"
@@ -74,6 +79,14 @@ class Domain(Folder):
         self.remotes = self._setup_dir(self.base, "remotes")
         self.is_mutable = kwargs.get(self.K_MUTABLE, True)
         self.data_yaml = Data(self.store)
+        cache_size = int(self.param(self.K_CACHE_SIZE, str(HashCache.DEFAULT_SIZE)))
+        self.hash_cache = HashCache(self.base, cache_size)
+        objects = self.base / self.cf.get_path(self.KEY_DIR + "objects")
+        self.blobs = (  # created on first use
+            BlobStore(objects, self.cf.digest_path)
+            if self.is_mutable and self.IsLocalPath(self.base)
+            else None
+        )
 
     #
     # Descriptors
@@ -117,7 +130,8 @@ class Domain(Folder):
             namespace = self[udi.package]
             assert namespace is not None
             no_copy = kwargs.get(self.K_NOCOPY, False)
-            namespace.pull(manifest, install_dir, no_copy=no_copy)
+            relax = kwargs.get(self.K_RELAX, {})
+            namespace.pull(manifest, install_dir, no_copy=no_copy, relax=relax)
         except ValueError as e:
             msg = f"Domain.pull.failed[{e}]: {udi}"
             if not kwargs.get(self.K_NEWOK, False):
@@ -126,6 +140,27 @@ class Domain(Folder):
 
         return install_dir
 
+    async def apull(self, udi: UDI, install_folder: UPath | None = None, **kwargs):
+        """Async version of `pull`, for running many transfers in one event loop."""
+        assert self.is_mutable, "Can not pull into read-only Domain"
+        install_dir = install_folder or self.package_path(udi.package)
+        install_dir.mkdir(parents=True, exist_ok=True)
+        self._track_lineage("pull", udi, install_dir, **kwargs)
+        try:
+            manifest = await asyncio.to_thread(self.GetRemoteManifest, udi)
+            namespace = self[udi.package]
+            assert namespace is not None
+            no_copy = kwargs.get(self.K_NOCOPY, False)
+            relax = kwargs.get(self.K_RELAX, {})
+            await namespace.apull(manifest, install_dir, no_copy=no_copy, relax=relax)
+        except ValueError as e:
+            msg = f"Domain.apull.failed[{e}]: {udi}"
+            if not kwargs.get(self.K_NEWOK, False):
+                raise ValueError(msg)
+            logging.warning(msg)
+
+        return install_dir
+
     def _status(self, attrs: dict, **kwargs) -> dict:
         """Return the status dictionary for this UDI event."""
         status = {
@@ -216,3 +251,14 @@ class Domain(Folder):
         remote = self.FromURI(remote_udi.registry)
         remote.pull(local_udi, **kwargs)
         return remote
+
+    async def apush(self, folder: Path, **kwargs):
+        """Async version of `push`."""
+        local_udi = self.folder2udi(folder)
+        assert local_udi is not None, f"UDI not found for: {folder}"
+        remote_udi = self.get_remote_udi(folder, **kwargs)
+        self._track_lineage("push", remote_udi, folder, **kwargs)
+        assert remote_udi is not None, f"UDI not found for: {folder}"
+        remote = self.FromURI(remote_udi.registry)
+        await remote.apull(local_udi, **kwargs)
+        return remote
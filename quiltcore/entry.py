@@ -1,6 +1,9 @@
 import logging
+import os
+import shutil
 from pathlib import Path
 from urllib.parse import parse_qs, urlparse
+from uuid import uuid4
 
 from upath import UPath
 
@@ -9,6 +12,7 @@ from .manifest import Manifest
 from .udg.child import Child
 from .udg.codec import Dict3, Dict4
 from .udg.types import Types
+from .udg.verifiable import VerifyingReader
 
 
 class Entry(Child, Dict4, Types):
@@ -84,10 +88,28 @@ class Entry(Child, Dict4, Types):
     # TODO: Need to rethink `install` since we do not pass Paths
     # Should this really be into a new Domain?
 
+    def open(self) -> VerifyingReader:
+        """Stream contents, raising ValueError at EOF if they do not match."""
+        fi = self.path.open("rb")
+        return VerifyingReader(fi, self.cf, self.multihash, self.size)
+
     def install(self, dest: str, **kwargs) -> "Entry":
-        """Copy contents of resource's path into `dest` directory."""
+        """
+        Copy contents of resource's path into `dest` directory,
+        moving them into place only once they have been verified.
+        """
         path = self.to_path(dest)
-        path.write_bytes(self.to_bytes())  # for binary files
+        tmp = path.with_name(f".{path.name}.{uuid4().hex}")
+        try:
+            with self.open() as fi, tmp.open("wb") as fo:
+                shutil.copyfileobj(fi, fo, self.cf.block_size())
+            if self.IsLocalPath(path):
+                os.replace(self.OsPath(tmp), self.OsPath(path))
+            else:
+                tmp.rename(path)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
         assert isinstance(self.parent, Manifest)
         clone = Entry(self.name, self.parent)
         logging.debug(f"clone[{type(path)}]: {path.stat()}")
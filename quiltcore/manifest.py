@@ -1,10 +1,13 @@
 import logging
+from copy import copy
 from pathlib import Path
 from typing import Iterator
 
 from .table3 import Table3, Tabular
 from .table4 import Table4
+from .udg.tablecache import TableCache
 from .udg.child import Child, Node
+from .udg.header import Header
 from .udg.types import Multihash
 
 
@@ -38,30 +41,63 @@ class Manifest(Child):
         manifests = params["manifests"]
         namespace = params["namespace"]
         source_dir = params["store"]
-        list4 = self.table().relax(install_dir, source_dir)
+        options = params.get("relax", {})
+        list4 = self.table().relax(install_dir, source_dir, **options)
         local_manifest = manifests / self.name
         self.save_manifest(list4, local_manifest)
         # Requires `parent` to be the Namespace containing `manifests`
         return Manifest(self.name, namespace)
 
+    async def arelax(self, install_dir: Path, params: dict) -> "Manifest":
+        """Async version of `relax`, transferring entries concurrently."""
+        manifests = params["manifests"]
+        namespace = params["namespace"]
+        source_dir = params["store"]
+        options = params.get("relax", {})
+        list4 = await self.table().arelax(install_dir, source_dir, **options)
+        local_manifest = manifests / self.name
+        self.save_manifest(list4, local_manifest)
+        return Manifest(self.name, namespace)
+
     #
     # Initialize Table
     #
 
     def table(self) -> Tabular:
-        """Load from Parquet or JSON."""
+        """
+        Load from Parquet or JSON, sharing parsed tables via TableCache.
+
+        Returns this Manifest's own copy of the cached table,
+        so changes to it are not seen by other Manifests.
+        """
         if not hasattr(self, "_table") or self._table is None:
             try:
-                factory = Table4 if self.path.suffix == Tabular.EXT4 else Table3
-                self._table = factory(self.path, **self.args)
+                key = self.cache_key()
+                cached = TableCache.Shared().get_or_load(key, self._load_table)
+                self._table = copy(cached)
             except FileNotFoundError:
                 logging.warning(f"Manifest not found: {self.path}")
         if not isinstance(self._table, Tabular):
             raise TypeError(f"Expected Table, got {type(self._table)}")
         return self._table
 
-    def header(self):
-        return self.table().header
+    def cache_key(self) -> tuple:
+        """TableCache key: top hash, load options, and (last, for discard) path."""
+        return (self.name, self.args.get(Tabular.K_LAZY_JSON), str(self.path))
+
+    def _load_table(self) -> Tabular:
+        factory = Table4 if self.path.suffix == Tabular.EXT4 else Table3
+        return factory(self.path, **self.args)
+
+    def header(self) -> Header:
+        """Return the Header, reading only the footer of footer-layout parquet."""
+        if self._table is None and self.path.suffix == Tabular.EXT4:
+            head = Table4.ReadHeader(self.path)
+            if head is not None:
+                return Header.FromDict4(head)
+        header = self.table().header
+        assert isinstance(header, Header), f"No header for {self.path}"
+        return header
 
     #
     # Hash functions
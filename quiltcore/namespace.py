@@ -2,6 +2,8 @@ import logging
 
 from pathlib import Path
 
+from .config.sortedindex import SortedIndex
+from .config.versionlog import Since, VersionLog
 from .domain import Domain
 from .manifest import Manifest
 from .udg.folder import Folder
@@ -18,7 +20,10 @@ class Namespace(Folder):
     """
 
     SEP = "/"
+    HASH_INDEX = "manifests.idx"
     HASH_LEN = 64
+    TAG_INDEX = "tags"
+    VERSION_LOG = "versions"
     Q3HASH_KEY = "hash"
     K_SAVE = "save"
 
@@ -26,6 +31,10 @@ class Namespace(Folder):
         super().__init__(name, parent, **kwargs)
         assert isinstance(self.parent, Domain)
         self.manifests = self._setup_dir(self.parent.base, "manifests")
+        index = self.parent.base / self.cf.get_path(self.KEY_DIR + "index")
+        self.hash_index = SortedIndex(index / self.HASH_INDEX)
+        self.tag_index = SortedIndex(index / self.TAG_INDEX / f"{self.name}.idx")
+        self.version_log = VersionLog(index / self.VERSION_LOG / f"{self.name}.log")
 
     #
     # GET based on hash
@@ -40,15 +49,13 @@ class Namespace(Folder):
         if len(key) == self.HASH_LEN:
             return key
 
-        hash = None
-        for match in self.manifests.rglob(f"{key}*"):
-            if hash is None:
-                hash = match.name
-            else:
-                raise ValueError(f"Multiple matches for hash: {key}")
-                # TODO: prefer Parquet if both present
-        if hash is not None:
-            return hash
+        matches = {hash for hash, _ in self.hash_index.prefix(key)}
+        if len(matches) < 2:  # include manifests written without the index
+            matches |= self._manifest_hashes(key)
+        if len(matches) > 1:
+            raise ValueError(f"Multiple matches for hash: {key} -> {sorted(matches)}")
+        if matches:
+            return matches.pop()
         raise ValueError(f"Tag/Hash not found: {key}")
 
     def _get(self, key: Tag):
@@ -57,6 +64,69 @@ class Namespace(Folder):
         logging.debug(f"Namespace2._get[{key}]: {hash} -> {parquet_hash}")
         return super()._get(hash)
 
+    def tags(self) -> dict[Tag, str]:
+        """
+        Return tag -> hash for this namespace, in tag order.
+
+        Hashes come from the tag index, except for the (movable) default
+        tag and tags written without the index, which are read from file.
+        """
+        if not self.tag_index.exists():
+            return dict(self._tag_files())
+        indexed = dict(self.tag_index.read())
+        tags = {}
+        for tag in sorted(self):
+            hash = indexed.get(tag)
+            if hash is None or tag == Domain.TAG_DEFAULT:
+                hash = self.read_hash_from_tag(tag)
+            tags[tag] = hash
+        return tags
+
+    def _tag_files(self) -> list[tuple[Tag, str]]:
+        return [(tag, self.read_hash_from_tag(tag)) for tag in sorted(self)]
+
+    def _manifest_hashes(self, prefix: str = "") -> set[str]:
+        """Return the hash of every quilt3 or parquet manifest starting with prefix."""
+        patterns = [f"{prefix}*"]
+        if prefix:
+            patterns.append(f"{Tabular.MULTIHASH}{prefix}*")
+        hashes = set()
+        for pattern in patterns:
+            for path in self.manifests.rglob(pattern):
+                name = path.name.removesuffix(Tabular.EXT4)
+                if len(name) == self.HASH_LEN + len(Tabular.MULTIHASH):
+                    name = name.removeprefix(Tabular.MULTIHASH)
+                if len(name) == self.HASH_LEN and name.startswith(prefix):
+                    hashes.add(name)
+        return hashes
+
+    def _ensure_indexes(self) -> None:
+        """Build missing indexes from existing files before updating them."""
+        self.hash_index.ensure(lambda: [(hash, "") for hash in self._manifest_hashes()])
+        self.tag_index.ensure(self._tag_files)
+
+    def versions(
+        self, since: Since = None, until: Since = None, limit: int = 0
+    ) -> list[tuple[Tag, str]]:
+        """
+        Return (timestamp tag, hash) for versions tagged in [since, until],
+        newest first, at most `limit` of them.
+
+        Timestamp tag files missing from the version log (e.g., written
+        by other clients) are merged into it first.
+        """
+        self._ensure_version_log()
+        entries = self.version_log.query(since, until, limit)
+        return [(str(tag), hash) for tag, hash in entries]
+
+    def _ensure_version_log(self) -> None:
+        """Seed the version log from timestamp tag files it does not list yet."""
+        logged = {str(tag) for tag, _ in self.version_log.read()}
+        missing = [tag for tag in self if tag.isdigit() and tag not in logged]
+        if missing or not self.version_log.exists():
+            entries = [(int(tag), self.read_hash_from_tag(tag)) for tag in missing]
+            self.version_log.merge(entries)
+
     #
     # PUT based on tag
     #
@@ -73,7 +143,9 @@ class Namespace(Folder):
         return tag
 
     def tag(self, hash: str, **options) -> Tag:
+        self._ensure_version_log()  # before the new tag file exists
         tag = self.Now()
+        self.version_log.append(tag, hash)  # so readers never merge it twice
         self._put(tag, hash)
         if self._valid(options):
             self._put(Domain.TAG_DEFAULT, hash)
@@ -81,21 +153,26 @@ class Namespace(Folder):
 
     def _put(self, tag: Tag, hash: str):
         """Put a hash into the namespace via a tag."""
+        self._ensure_indexes()
         hash_file = self.path / tag
         hash_file.parent.mkdir(parents=True, exist_ok=True)
         hash_file.write_text(hash)
+        self.tag_index.put(tag, hash)
+        self.hash_index.put(hash)
         logging.debug(f"Namespace2.put[{tag}]: {hash_file}")
 
     def _save(self, list4: List4, top_hash: str):
+        self._ensure_indexes()
         manifest_path = self.manifests / top_hash
         manifest_path.parent.mkdir(parents=True, exist_ok=True)
-        Tabular.WriteParquet(list4, manifest_path)
+        Tabular.WriteParquet(list4, manifest_path, self.cf)
+        self.hash_index.put(top_hash)
 
     #
     # PULL via relaxation
     #
 
-    def relax_params(self) -> dict:
+    def relax_params(self, relax: dict = {}) -> dict:
         domain = self.parent
         assert isinstance(domain, Domain)
         return {
@@ -103,12 +180,27 @@ class Namespace(Folder):
             "namespace": self,
             "store": domain.store,
             "package_path": domain.package_path(self.name),
+            "relax": {
+                Tabular.K_BLOBS: domain.blobs,
+                Tabular.K_HASH_CACHE: domain.hash_cache,
+                **relax,
+            },
         }
 
     def pull(self, manifest: Manifest, install_dir: Path, **flags) -> Tag:
         """PUT relaxed manifest into the namespace."""
         assert isinstance(manifest, Manifest)
         if not flags.get("no_copy", False):
-            manifest = manifest.relax(install_dir, self.relax_params())
+            params = self.relax_params(flags.get("relax", {}))
+            manifest = manifest.relax(install_dir, params)
+            assert manifest is not None
+        return self.tag(manifest.q3hash())
+
+    async def apull(self, manifest: Manifest, install_dir: Path, **flags) -> Tag:
+        """Async version of `pull`."""
+        assert isinstance(manifest, Manifest)
+        if not flags.get("no_copy", False):
+            params = self.relax_params(flags.get("relax", {}))
+            manifest = await manifest.arelax(install_dir, params)
             assert manifest is not None
         return self.tag(manifest.q3hash())
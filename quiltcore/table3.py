@@ -1,23 +1,80 @@
+import io
+import json
 import logging
 
 import pyarrow as pa  # type: ignore
+import pyarrow.compute as pc  # type: ignore
 import pyarrow.json as pj  # type: ignore
 
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+from .udg.codec import Codec
 from .udg.header import Header
-from .udg.types import Dict3, Dict4
+from .udg.types import Dict3, Dict4, List4
 from .udg.tabular import Tabular
 
 
 class Table3(Tabular):
     """Abstract Pyarrow table of quilt3 JSON manifest."""
 
+    K_BLOCK_SIZE = "block_size"
+
+    @classmethod
+    def BlockSize(cls, codec: Codec) -> int:
+        return int(codec.get_dict("tabular").get(cls.K_BLOCK_SIZE, 1 << 20))
+
+    @classmethod
+    def ReadBatches(
+        cls, fi: BinaryIO, block_size: int, codec: Codec | None = None
+    ) -> Iterator[pa.Table]:
+        """
+        Incrementally parse the rest of a JSONL stream, one table per block.
+
+        Each block of whole lines is parsed on its own, so open-ended
+        structs (e.g., `meta`) may take a different shape in every block.
+        """
+        parse_options = (codec or Codec()).parse_options()
+        rest = b""
+        while chunk := fi.read(block_size):
+            chunk = rest + chunk
+            end = chunk.rfind(b"\n") + 1
+            rest = chunk[end:]
+            if end:
+                yield cls.ParseBlock(chunk[:end], parse_options)
+        if rest.strip():
+            yield cls.ParseBlock(rest, parse_options)
+
+    @staticmethod
+    def ParseBlock(block: bytes, parse_options: pj.ParseOptions) -> pa.Table:
+        read_options = pj.ReadOptions(block_size=len(block) + 1)
+        return pj.read_json(
+            io.BytesIO(block), read_options=read_options, parse_options=parse_options
+        )
+
+    @classmethod
+    def IterDict4(cls, path: Path, block_size: int = 0) -> Iterator[Dict4]:
+        """
+        Stream a quilt3 manifest without loading it all into memory.
+
+        Yields the header, then each row of the body, decoding
+        one block (of `block_size` bytes) at a time.
+        """
+        codec = Codec()
+        block_size = block_size or cls.BlockSize(codec)
+        with path.open(mode="rb") as fi:
+            header = Header(json.loads(fi.readline()))
+            yield header.to_dict4()
+            for batch in cls.ReadBatches(fi, block_size, codec):
+                yield from codec.decode_batch(batch)
+
     #
     # Parse Table
     #
 
     def _get_table(self) -> pa.Table:
         with self.path.open(mode="rb") as fi:
-            return pj.read_json(fi)
+            return pj.read_json(fi, parse_options=self.codec.parse_options())
 
     def _get_head(self) -> Dict4:
         """Extract header values into Dict4 attributes."""
@@ -38,17 +95,22 @@ class Table3(Tabular):
     #
 
     def names(self) -> list[str]:
-        if self.codec.name_col:
+        if self.codec.name_col is not None:
             return [self.HEADER_NAME] + self.codec.name_col.to_pylist()
         return super().names()
 
+    def name_column(self) -> pa.ChunkedArray:
+        return self.body.column(self.codec.K_NAM)
+
+    def hash_values(self) -> pa.ChunkedArray:
+        return pc.struct_field(self.body.column(self.codec.K_HASH), "value")
+
     def get_dict3(self, key: str) -> Dict3:
         """Return the dict3 for a child resource."""
-        # TODO: cache to avoid continually re-calcluating
-        index = self.codec.index_name(key).as_py()  # type: ignore
+        index = self.row_index(key)
         if index < 0:
-            raise ValueError(f"Key[{key}] not found in: {self.names()} ")
-        pa_list = self.body.take([index]).to_pylist()
+            raise ValueError(f"Key[{key}] not found in: {self.path}")
+        pa_list = self.body.slice(index, 1).to_pylist()
         pa_dict = pa_list[0]
         del pa_dict[self.codec.K_NAM]
 
@@ -62,3 +124,6 @@ class Table3(Tabular):
             return self.head
         pa_dict3 = self.get_dict3(key)
         return self.codec.decode_dict3(pa_dict3)
+
+    def batch_to_list4(self, batch: pa.Table) -> List4:
+        return self.codec.decode_batch(batch)
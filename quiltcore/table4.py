@@ -1,43 +1,190 @@
 import logging  # noqa: F401
 
 import pyarrow as pa  # type: ignore
+import pyarrow.compute as pc  # type: ignore
 
-from .udg.types import Dict4
+from pathlib import Path
+from pyarrow.parquet import ParquetFile, RowGroupMetaData
+
+from .udg.header import Header
+from .udg.types import Dict4, List4
 from .udg.tabular import Tabular
 
 
 class Table4(Tabular):
     """Abstract Pyarrow table of quilt4 Parquet manifest."""
 
+    @classmethod
+    def StoredColumns(cls, columns: list[str], stored: list[str]) -> list[str]:
+        """Map Dict4 field names to the (possibly JSON-encoded) stored columns."""
+        result = []
+        for column in columns:
+            json_column = f"{column}.json"
+            if column not in stored and json_column in stored:
+                column = json_column
+            if column not in stored:
+                raise KeyError(f"Column[{column}] not in {stored}")
+            result.append(column)
+        return result
+
+    @staticmethod
+    def PrefixEnd(prefix: str) -> str:
+        """Return the smallest string greater than all strings with prefix."""
+        return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+    @classmethod
+    def RowGroupMatches(
+        cls, row_group: RowGroupMetaData, prefix="", min_size=None, max_size=None
+    ) -> bool:
+        """Use row group statistics to decide if any row could match."""
+        for i in range(row_group.num_columns):
+            column = row_group.column(i)
+            stats = column.statistics
+            if stats is None or not stats.has_min_max:
+                continue
+            match column.path_in_schema:
+                case cls.K_NAME if prefix:
+                    if stats.max < prefix or stats.min >= cls.PrefixEnd(prefix):
+                        return False
+                case cls.K_SIZE:
+                    if min_size is not None and stats.max < min_size:
+                        return False
+                    if max_size is not None and stats.min > max_size:
+                        return False
+        return True
+
+    @classmethod
+    def FilterRows(
+        cls, table: pa.Table, prefix="", min_size=None, max_size=None
+    ) -> pa.Table:
+        """Keep only rows whose name starts with prefix and size is in range."""
+        masks = []
+        if prefix:
+            masks.append(pc.starts_with(table.column(cls.K_NAME), prefix))
+        if min_size is not None:
+            masks.append(pc.greater_equal(table.column(cls.K_SIZE), min_size))
+        if max_size is not None:
+            masks.append(pc.less_equal(table.column(cls.K_SIZE), max_size))
+        if not masks:
+            return table
+        mask = masks[0]
+        for other in masks[1:]:
+            mask = pc.and_(mask, other)
+        return table.filter(mask)
+
+    @classmethod
+    def Scan(
+        cls,
+        path: Path,
+        columns: list[str] | None = None,
+        prefix: str = "",
+        min_size: int | None = None,
+        max_size: int | None = None,
+    ) -> pa.Table:
+        """
+        Read only the matching rows and requested columns of a parquet manifest.
+
+        * Row groups are skipped using their `name` and `size` statistics
+        * JSON columns (info, meta) are only decoded if requested
+        * The header row is included if it matches
+        """
+        with path.open(mode="rb") as fi:
+            pf = ParquetFile(fi)
+            stored = pf.schema_arrow.names
+            wanted = cls.StoredColumns(columns or stored, stored)
+            filters = [cls.K_NAME] if prefix else []
+            if min_size is not None or max_size is not None:
+                filters.append(cls.K_SIZE)
+            read = wanted + [c for c in filters if c not in wanted]
+            tables = []
+            for i in range(pf.num_row_groups):
+                row_group = pf.metadata.row_group(i)
+                if not cls.RowGroupMatches(row_group, prefix, min_size, max_size):
+                    logging.debug(f"Table4.Scan: skip row group {i} of {path}")
+                    continue
+                table = pf.read_row_group(i, columns=read)
+                table = cls.FilterRows(table, prefix, min_size, max_size)
+                tables.append(table.select(wanted))
+            if tables:
+                result = pa.concat_tables(tables)
+            else:
+                result = pf.schema_arrow.empty_table().select(wanted)
+        return cls.UnparseTable(result, bulk=True)
+
+    @classmethod
+    def ScanDir(
+        cls, path: Path, dir: str, columns: list[str] | None = None
+    ) -> pa.Table:
+        """
+        Return the body rows of all entries under `dir` (e.g., "data/2024/"),
+        reading only row groups whose `name` statistics could match.
+
+        Pruning is most effective for manifests written with `sort_by_name`.
+        """
+        prefix = dir if not dir or dir.endswith("/") else f"{dir}/"
+        read = (
+            columns + [cls.K_NAME] if columns and cls.K_NAME not in columns else columns
+        )
+        table = cls.Scan(path, read, prefix=prefix)
+        table = table.filter(pc.not_equal(table.column(cls.K_NAME), cls.HEADER_NAME))
+        return table.select(columns) if columns else table
+
+    @classmethod
+    def ReadHeader(cls, path: Path) -> Dict4 | None:
+        """
+        Return the header Dict4 from the parquet footer alone,
+        or None if the file stores its header as row 0.
+        """
+        with path.open(mode="rb") as fi:
+            metadata = ParquetFile(fi).metadata.metadata
+        return cls.FooterHead(metadata)
+
     def _get_table(self) -> pa.Table:
-        return self.ReadParquet(self.path)
+        return self.ReadParquet(self.path, self.lazy)
 
-    def _get_head(self) -> pa.Table:
+    def _get_head(self) -> Dict4:
         """Extract header values into attributes."""
-        return Dict4.V2(**self.first())
+        footer = self.FooterHead(self.table.schema.metadata)
+        self.footer = footer is not None
+        head = footer or Dict4.V2(**self.first())
+        self.header = Header.FromDict4(head)
+        return head
 
     def _get_body(self) -> pa.Table:
         """
         Extract header values into attributes.
         Return the Table without header row and columns
         """
-        return self.table.slice(1)
+        return self.table if self.footer else self.table.slice(1)
 
     #
     # Query Table
     #
 
     def names(self) -> list[str]:
-        return self.table.column("name").to_pylist()
+        names = self.name_column().to_pylist()
+        return [self.HEADER_NAME] + names if self.footer else names
+
+    def name_column(self) -> pa.ChunkedArray:
+        return self.table.column("name")
+
+    def hash_values(self) -> pa.ChunkedArray:
+        return self.codec.hash_value_column(self.body.column("multihash"))
 
     def get_row(self, key: str) -> dict:
         """Return the row for a child resource."""
-        condition = pa.compute.equal(self.table.column("name"), key)
-        result = self.table.filter(condition).to_pylist()
-        return result[0] if len(result) == 1 else {}
+        if self.footer and key == self.HEADER_NAME:
+            return self.head.to_dict()
+        index = self.row_index(key)
+        if index < 0:
+            return {}
+        return self.ParseRow(self.table.slice(index, 1).to_pylist()[0])
 
     def get_dict4(self, key: str) -> Dict4:
         """Return the dict4 for a child resource."""
         row = self.get_row(key)
         assert row, f"Missing row for {key}"
         return Dict4.V2(**row)
+
+    def batch_to_list4(self, batch: pa.Table) -> List4:
+        return [Dict4.V2(**row) for row in self.ParseRows(batch)]
@@ -15,8 +15,7 @@ class Child(Node):
         assert parent == self.parent, f"Child.init: {parent} != {self.parent}"
 
     def dict4_to_meta3(self, dict4: Dict4) -> dict:
-        meta = dict4.info
-        meta[self.K_USER_META] = dict4.meta
+        meta = {**dict4.info, self.K_USER_META: dict4.meta}
         return self.cf.encode_dates(meta)
 
     def dict4_to_dict3(self, dict4: Dict4) -> Dict3:
@@ -37,25 +36,18 @@ class Child(Node):
             return base
 
     def save_manifest(self, list4: List4, path: Path, msg="", writeJSON=True) -> Path:
-        print(f"save_manifest: {list4} to {path}")
-        assert list4, "save_manifest: list4 is empty; cannot save to {path}}"
-        parquet_path = Tabular.WriteParquet(list4, path)
+        assert list4, f"save_manifest: list4 is empty; cannot save to {path}"
+        parquet_path = Tabular.WriteParquet(list4, path, self.cf)
         if writeJSON:
+            header = [dict4 for dict4 in list4 if dict4.name == Tabular.HEADER_NAME]
             if msg:
                 head4 = Header.HeaderDict4(msg)
+            elif not header:
+                raise ValueError(f"save_manifest: no header in {path}")
             else:
-                header = [dict4 for dict4 in list4 if dict4.name == Tabular.HEADER_NAME]
-                print(f"save_manifest.header: {header}")
-                if not header:
-                    raise ValueError(f"save_manifest: no header in {list4}")
-                else:
-                    head4 = header[0]
-                    print(f"save_manifest.head4: {head4}")
-                    list4.remove(head4)
-            print(f"save_manifest.head4: {head4}")
+                head4 = header[0]
             meta3 = self.dict4_to_meta3(head4)
-            print(f"save_manifest.meta3: {meta3}")
-            body3: list[Dict3] = [self.dict4_to_dict3(dict4) for dict4 in list4]
-            print(f"save_manifest.body3: {body3}")
-            Tabular.WriteJSON(meta3, body3, path)
+            body4 = [dict4 for dict4 in list4 if dict4.name != Tabular.HEADER_NAME]
+            body = Tabular.ListTable(body4, self.cf.json_default)
+            Tabular.WriteJSONL(meta3, body, path, self.cf)
         return parquet_path
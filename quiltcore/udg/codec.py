@@ -1,9 +1,14 @@
+import hashlib
 import logging
+import mmap
 import pyarrow as pa  # type: ignore
 import pyarrow.compute as pc  # type: ignore
+import pyarrow.json as pj  # type: ignore
 
-from json import JSONEncoder
+from json import JSONEncoder, dumps as json_dumps
 from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO
 from urllib.parse import quote, unquote
 
 from multiformats import multihash
@@ -63,6 +68,51 @@ class Codec(Config, Types):
         """Return a dict of values to encode, and their mappings."""
         return self.get_dict(f"{self.scheme}/{value}")
 
+    #
+    # Arrow Schema
+    #
+
+    @staticmethod
+    def ArrowType(type_name) -> pa.DataType | None:
+        """Return the Arrow type for a config type, or None if open-ended."""
+        if isinstance(type_name, dict):
+            fields = [(k, Codec.ArrowType(v)) for k, v in type_name.items()]
+            if any(t is None for _, t in fields):
+                return None
+            return pa.struct(fields)
+        try:
+            return pa.type_for_alias(type_name)
+        except ValueError:
+            return None
+
+    def arrow_schema(self) -> pa.Schema:
+        """
+        Explicit Arrow schema for quilt3 manifest rows, from the config file.
+
+        Open-ended structs (e.g., `meta` and `user_meta`) are omitted,
+        since their shape varies between manifests; those are still inferred.
+        """
+        fields = []
+        for header, default in self.get_dict(f"{self.scheme}/headers").items():
+            if isinstance(default, str):
+                fields.append((header, pa.string()))
+        for key3, opts in self.coding.items():
+            format = opts.get("format")
+            type_name = format if isinstance(format, dict) else opts.get("type")
+            arrow_type = self.ArrowType(type_name)
+            if arrow_type is None:
+                continue
+            if opts.get(self.T_LST, False):
+                arrow_type = pa.list_(arrow_type)
+            fields.append((key3, arrow_type))
+        return pa.schema(fields)
+
+    def parse_options(self) -> pj.ParseOptions:
+        """JSON parse options that skip inference for known columns."""
+        return pj.ParseOptions(
+            explicit_schema=self.arrow_schema(), unexpected_field_behavior="infer"
+        )
+
     #
     # Table Operations
     #
@@ -81,11 +131,72 @@ class Codec(Config, Types):
         source = self.config(self.K_MAP)[self.K_NAM]
         opts = self.coding.get(source, {})
         input = body.column(source)
-        new_col = [self.decode_list(input, opts)]
+        new_col = self.decode_column(input, opts)
         with_names = body.append_column(self.K_NAM, new_col)
         self.name_col = with_names.column(self.K_NAM)
         return with_names
 
+    def decode_column(self, column: pa.ChunkedArray, opts={}) -> pa.ChunkedArray:
+        """Decode an entire column with Arrow compute kernels."""
+        self.check_opts(opts)
+        if self.check(self.T_HSH):
+            return self.decode_item(column, opts)
+        if self.check(self.T_LST):
+            column = pc.list_element(column, 0)
+        if self.check(self.T_QTD):
+            column = pa.chunked_array(
+                [self.unquote_array(chunk) for chunk in column.chunks],
+                type=pa.string(),
+            )
+        return column
+
+    @staticmethod
+    def unquote_array(array: pa.Array) -> pa.Array:
+        """Unquote only those values that contain percent-escapes."""
+        array = array.cast(pa.string())
+        escaped = pc.fill_null(pc.match_substring(array, "%"), False)
+        if not pc.any(escaped).as_py():
+            return array
+        values = array.filter(escaped).to_pylist()
+        unquoted = pa.array([unquote(value) for value in values], pa.string())
+        return pc.replace_with_mask(array, escaped, unquoted)
+
+    def decode_hash_column(self, column: pa.ChunkedArray) -> pa.ChunkedArray:
+        """Convert a column of quilt3 hash_structs into multihash strings."""
+        prefixes = self.hash_config(self.MH_PRE)
+        types = pc.struct_field(column, "type")
+        values = pc.struct_field(column, "value")
+        found = pc.index_in(types, value_set=pa.array(list(prefixes.keys())))
+        if found.null_count > types.null_count:
+            unknown = pc.filter(types, pc.is_null(found)).unique().to_pylist()
+            raise KeyError(f"Unknown hash types {unknown} not in [{prefixes}]")
+        prefix_col = pc.take(pa.array(list(prefixes.values())), found)
+        return pc.binary_join_element_wise(prefix_col, values, "")
+
+    def decode_batch(self, batch: pa.Table) -> list[Dict4]:
+        """Decode a table of quilt3 rows into Dict4s, column by column."""
+        columns: dict[str, list] = {}
+        for key3, opts in self.coding.items():
+            if key3 not in batch.column_names:
+                continue
+            key4 = opts.get(self.K_NAM, key3)
+            column = batch.column(key3)
+            if opts.get(self.T_HSH, False):
+                column = self.decode_hash_column(column)
+            else:
+                column = self.decode_column(column, opts)
+            columns[key4] = column.to_pylist()
+
+        list4 = []
+        for i in range(batch.num_rows):
+            decoded = {key4: values[i] for key4, values in columns.items()}
+            decoded[self.K_META] = {}
+            info = decoded.setdefault("info", {})
+            if info and self.K_USER_META in info:
+                decoded[self.K_META] = info.pop(self.K_USER_META)
+            list4.append(Dict4.V2(**decoded))
+        return list4
+
     def index_name(self, name: str) -> int:
         """Return the row index for a column name."""
         return pc.index(self.name_col, name)
@@ -115,6 +226,43 @@ class Codec(Config, Types):
         """return multihash digest as hex"""
         return self.digest_raw(bstring).hex()
 
+    def hasher(self, hash_type=None):
+        """return incremental hash object for streaming digests"""
+        ht = hash_type or self.config("hash_type")
+        return hashlib.new(self.hash_config(self.MH_STR)[ht])
+
+    def block_size(self) -> int:
+        """return number of bytes to read per block when streaming"""
+        return int(self.hash_config(self.MH_BLK))
+
+    def digest_stream(self, stream: BinaryIO) -> bytes:
+        """return multihash digest of a binary stream, read block by block"""
+        hasher = self.hasher()
+        block_size = self.block_size()
+        while block := stream.read(block_size):
+            hasher.update(block)
+        return self.digester().wrap(hasher.digest())
+
+    def digest_path(self, path: Path) -> bytes:
+        """return multihash digest of a (local or remote) file"""
+        if self.IsLocalPath(path) and self.hash_config(self.MH_MAP):
+            return self.digest_mmap(self.OsPath(path))
+        with path.open(mode="rb") as fi:
+            return self.digest_stream(fi)
+
+    def digest_mmap(self, path: Path) -> bytes:
+        """return multihash digest of a local file, hashed from a memory map"""
+        hasher = self.hasher()
+        block_size = self.block_size()
+        with open(path, mode="rb") as fi:
+            if path.stat().st_size > 0:
+                with mmap.mmap(fi.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        for start in range(0, len(view), block_size):
+                            end = start + block_size
+                            hasher.update(view[start:end])
+        return self.digester().wrap(hasher.digest())
+
     def decode_q3hash(self, q3hash: str) -> Multihash:
         hash_type = self.config("hash_type")
         prefix = self.hash_config(self.MH_PRE)[hash_type]
@@ -202,6 +350,128 @@ class Codec(Config, Types):
 
         return value
 
+    #
+    # Columnar Encoder Methods
+    #
+
+    JSON_ESCAPE = r'["\\\x00-\x1f]'
+    URI_UNSAFE = r"[^A-Za-z0-9_.\-~/:?=]"
+
+    @staticmethod
+    def ReplaceMatching(array: pa.Array, pattern: str, fn) -> pa.Array:
+        """Apply Python `fn` only to the values that match a regex."""
+        if isinstance(array, pa.ChunkedArray):
+            array = array.combine_chunks()
+        array = array.cast(pa.string())
+        mask = pc.fill_null(pc.match_substring_regex(array, pattern), False)
+        if not pc.any(mask).as_py():
+            return array
+        values = array.filter(mask).to_pylist()
+        replaced = pa.array([fn(value) for value in values], pa.string())
+        return pc.replace_with_mask(array, mask, replaced)
+
+    @classmethod
+    def JSONStrings(cls, array: pa.Array) -> pa.Array:
+        """Render strings as JSON string literals, escaping only where needed."""
+        escaped = cls.ReplaceMatching(
+            array, cls.JSON_ESCAPE, lambda v: json_dumps(v, ensure_ascii=False)[1:-1]
+        )
+        return pc.binary_join_element_wise('"', escaped, '"', "")
+
+    def json_default(self, value) -> str:
+        """JSON fallback that formats dates for quilt3 metadata."""
+        return self.encode_date(value) if hasattr(value, "strftime") else str(value)
+
+    def hash_type_column(self, multihashes: pa.Array) -> pa.Array:
+        """Return the quilt3 hash type of each multihash, checking prefixes."""
+        prefixes = self.hash_config(self.MH_PRE)
+        prefix = pc.utf8_slice_codeunits(multihashes, 0, 4)
+        found = pc.index_in(prefix, value_set=pa.array(list(prefixes.values())))
+        if found.null_count > multihashes.null_count:
+            unknown = pc.filter(prefix, pc.is_null(found)).unique().to_pylist()
+            raise ValueError(f"Prefixes {unknown} not in [{prefixes}]")
+        return pc.take(pa.array(list(prefixes.keys())), found)
+
+    def hash_value_column(self, multihashes: pa.Array) -> pa.Array:
+        """Strip multihash prefixes, leaving quilt3 hash values (vectorized q3hash)."""
+        self.hash_type_column(multihashes)
+        return pc.utf8_slice_codeunits(multihashes, 4)
+
+    def encode_hash_column(self, multihashes: pa.Array) -> pa.Array:
+        """Render multihash strings as JSON quilt3 hash_structs."""
+        types = self.hash_type_column(multihashes)
+        values = pc.utf8_slice_codeunits(multihashes, 4)
+        return pc.binary_join_element_wise(
+            '{"type": "', types, '", "value": "', values, '"}', ""
+        )
+
+    def digest_strings(self, head: bytes, values: pa.Array) -> bytes:
+        """
+        Return the multihash digest of `head` followed by every string in values,
+        streaming each chunk's UTF-8 data buffer into one hasher (no joined copy).
+        """
+        if values.null_count:
+            raise ValueError(f"digest_strings: {values.null_count} null values")
+        hasher = self.hasher()
+        hasher.update(head)
+        chunks = values.chunks if isinstance(values, pa.ChunkedArray) else [values]
+        for chunk in chunks:
+            if len(chunk) == 0:
+                continue
+            _, offsets, data = chunk.buffers()
+            offsets = memoryview(offsets).cast("i")
+            first = offsets[chunk.offset]
+            last = offsets[chunk.offset + len(chunk)]
+            hasher.update(memoryview(data)[first:last])
+        return self.digester().wrap(hasher.digest())
+
+    def encode_meta_column(self, info: pa.Array, meta: pa.Array) -> pa.Array:
+        """Nest non-empty `meta.json` as `user_meta` inside `info.json`."""
+        has_user = pc.fill_null(pc.not_equal(meta, "{}"), False)
+        only_user = pc.binary_join_element_wise('{"user_meta": ', meta, "}", "")
+        body = pc.utf8_slice_codeunits(info, 0, -1)
+        nested = pc.binary_join_element_wise(body, ', "user_meta": ', meta, "}", "")
+        with_user = pc.if_else(pc.equal(info, "{}"), only_user, nested)
+        return pc.if_else(has_user, with_user, info)
+
+    def encode_lines(self, body: pa.Table) -> pa.Array:
+        """
+        Encode a body table (see `Tabular.ListTable`) as quilt3 JSONL lines,
+        each ending in a newline, matching the per-row Dict3 encoding.
+
+        Raises ValueError on null values (except `workflow`), which would
+        otherwise null out, and so drop, the whole line.
+        """
+        for key in ["name", "place", "size", "multihash", "info.json", "meta.json"]:
+            nulls = body.column(key).null_count
+            if nulls:
+                raise ValueError(f"encode_lines: {nulls} null values in {key}")
+        places = self.ReplaceMatching(
+            body.column("place"),
+            self.URI_UNSAFE,
+            lambda v: quote(v, safe=self.UNQUOTED),
+        )
+        workflow = pc.fill_null(self.JSONStrings(body.column("workflow")), "null")
+        return pc.binary_join_element_wise(
+            '{"logical_key": ',
+            self.JSONStrings(body.column("name")),
+            ', "physical_keys": ["',
+            places,
+            '"], "size": ',
+            pc.cast(body.column("size"), pa.string()),
+            ', "hash": ',
+            self.encode_hash_column(body.column("multihash").combine_chunks()),
+            ', "meta": ',
+            self.encode_meta_column(
+                body.column("info.json").combine_chunks(),
+                body.column("meta.json").combine_chunks(),
+            ),
+            ', "workflow": ',
+            workflow,
+            "}\n",
+            "",
+        )
+
     #
     # Decoder Methods
     #
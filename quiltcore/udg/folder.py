@@ -1,8 +1,10 @@
 from pathlib import Path
 from typing import Iterator
 
+from ..config.hashcache import HashCache
 from .child import Child
 from .node import Node
+from .pool import Pool
 from .types import List4, Dict4
 
 
@@ -31,12 +33,40 @@ class Folder(Child):
         gen = self.path.rglob(self.glob) if self.recurse else self.path.glob(self.glob)
         return (str(x.relative_to(self.path)) for x in gen)
 
-    def expand_path(self, file) -> Dict4:
-        base = self.dict4_from_path(file)
+    def expand_path(self, file, raw_hash: bytes | None = None) -> Dict4:
+        if raw_hash is None:
+            base = self.dict4_from_path(file)
+        else:
+            base = self.dict4_from_hash(file, raw_hash)
         result = self.encode_date_dicts(base)
         assert isinstance(result, Dict4)
         return result
 
+    def hash_pool(self) -> Pool:
+        """Return the (possibly parallel) engine used to hash files."""
+        return Pool.FromParams(self.params)
+
+    def digest_files(self, files: list[Path]) -> list[bytes]:
+        """Return raw multihashes, only hashing files missing from hash_cache."""
+        cache = self.hash_cache
+        if cache is None:
+            return list(self.hash_pool().map(self.cf.digest_path, files))
+        keys = [HashCache.StatKey(file) for file in files]
+        cached = [cache.get(key) for key in keys]
+        misses = [file for file, raw in zip(files, cached) if raw is None]
+        fresh = self.hash_pool().map(self.cf.digest_path, misses)
+        digests = []
+        for file, key, raw in zip(files, keys, cached):
+            if raw is None:
+                raw = next(fresh)
+                if HashCache.StatKey(file) == key:
+                    cache.put(key, raw)
+            digests.append(raw)
+        cache.save()
+        return digests
+
     def to_list4(self, folder: Path, glob=DEFAULT_GLOB) -> List4:
         """Generate to_dict4 for each file in path matching glob."""
-        return [self.expand_path(file) for file in folder.rglob(glob)]
+        files = list(folder.rglob(glob))
+        digests = self.digest_files(files)
+        return [self.expand_path(file, raw) for file, raw in zip(files, digests)]
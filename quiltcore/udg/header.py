@@ -48,6 +48,12 @@ class Header(Codec):
         first = cls.First(message)
         return cls(first)
 
+    @classmethod
+    def FromDict4(cls, dict4: Dict4) -> "Header":
+        """Rebuild a Header from its Dict4 row (info plus `meta` as user_meta)."""
+        first = {**dict4.info, cls.K_USER_META: dict4.meta or {}}
+        return cls(first)
+
     def __init__(self, first: dict, **kwargs):
         super().__init__(**kwargs)
         self.cols: list[str] = []
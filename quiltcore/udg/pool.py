@@ -0,0 +1,115 @@
+import logging
+import os
+
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from threading import Condition
+from typing import Callable, Iterable, Iterator
+
+
+class Pool:
+    """
+    Bounded worker pool that yields results in submission order.
+
+    Configured from resource params:
+
+    * executor: "thread" or "process"
+    * workers: number of workers (0 = one per CPU, 1 = run serially)
+    * queue: maximum number of tasks in flight at once
+    * chunk: number of items handed to a worker per task
+    """
+
+    K_EXECUTOR = "executor"
+    K_WORKERS = "workers"
+    K_QUEUE = "queue"
+    K_CHUNK = "chunk"
+    THREAD = "thread"
+    EXECUTORS: dict[str, type[Executor]] = {
+        THREAD: ThreadPoolExecutor,
+        "process": ProcessPoolExecutor,
+    }
+
+    @classmethod
+    def FromParams(cls, params: dict) -> "Pool":
+        return cls(
+            workers=int(params.get(cls.K_WORKERS, 1)),
+            queue=int(params.get(cls.K_QUEUE, 0)),
+            chunk=int(params.get(cls.K_CHUNK, 1)),
+            executor=params.get(cls.K_EXECUTOR, "thread"),
+        )
+
+    @staticmethod
+    def _run_chunk(fn: Callable, chunk: list) -> list:
+        return [fn(item) for item in chunk]
+
+    def __init__(self, workers=1, queue=0, chunk=1, executor="thread"):
+        if executor not in self.EXECUTORS:
+            raise ValueError(f"Unknown executor[{executor}]: {list(self.EXECUTORS)}")
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.queue = queue if queue > 0 else 2 * self.workers
+        self.chunk = max(chunk, 1)
+        self.executor = executor
+
+    def __repr__(self) -> str:
+        return (
+            f"Pool({self.executor}, workers={self.workers}, "
+            + f"queue={self.queue}, chunk={self.chunk})"
+        )
+
+    def _chunks(self, items: Iterable) -> Iterator[list]:
+        chunk: list = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= self.chunk:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def map(self, fn: Callable, items: Iterable) -> Iterator:
+        """Apply `fn` to each item, keeping at most `queue` tasks in flight."""
+        if self.workers == 1:
+            yield from map(fn, items)
+            return
+        logging.debug(f"Pool.map: {self}")
+        klass = self.EXECUTORS[self.executor]
+        with klass(max_workers=self.workers) as pool:
+            pending: deque = deque()
+            for chunk in self._chunks(items):
+                pending.append(pool.submit(self._run_chunk, fn, chunk))
+                if len(pending) >= self.queue:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+
+class Budget:
+    """
+    Shared limit on a quantity in flight (e.g., bytes being copied).
+
+    `acquire` blocks until the amount fits under the limit;
+    amounts larger than the limit are clamped so they can run alone.
+    A limit of 0 means unlimited.
+    """
+
+    def __init__(self, limit: int = 0):
+        self.limit = limit
+        self.used = 0
+        self._cond = Condition()
+
+    def acquire(self, amount: int) -> int:
+        """Reserve `amount`; return what was reserved, for `release`."""
+        if self.limit <= 0:
+            return 0
+        amount = min(max(amount, 0), self.limit)
+        with self._cond:
+            self._cond.wait_for(lambda: self.used + amount <= self.limit)
+            self.used += amount
+        return amount
+
+    def release(self, amount: int) -> None:
+        if amount <= 0:
+            return
+        with self._cond:
+            self.used -= amount
+            self._cond.notify_all()
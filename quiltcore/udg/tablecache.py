@@ -0,0 +1,107 @@
+import logging
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Hashable
+
+from .codec import Codec
+
+
+class TableCache:
+    """
+    Process-wide, byte-bounded LRU cache of parsed manifest tables.
+
+    Keys combine the manifest's top hash with its path, so manifests
+    (which are immutable by hash) never need to be re-read; writers
+    call `discard_path` when they replace a file in place.
+    """
+
+    DEFAULT_BYTES = 512 * 1024 * 1024
+    K_CACHE_BYTES = "cache_bytes"
+    _shared: "TableCache | None" = None
+    _shared_lock = Lock()
+
+    @classmethod
+    def Shared(cls) -> "TableCache":
+        """Return the process-wide cache, sized by `tabular/cache_bytes`."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                tabular = Codec().get_dict("tabular")
+                cls._shared = cls(
+                    int(tabular.get(cls.K_CACHE_BYTES, cls.DEFAULT_BYTES))
+                )
+            return cls._shared
+
+    @staticmethod
+    def NBytes(table) -> int:
+        """Approximate memory held by a Tabular."""
+        return int(getattr(table.table, "nbytes", 0))
+
+    def __init__(self, max_bytes: int = DEFAULT_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[object, int]] = OrderedDict()
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"TableCache({len(self)} tables, {self.nbytes}/{self.max_bytes} bytes, "
+            + f"hits={self.hits}, misses={self.misses})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable):
+        """Return the cached table for key, marking it recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, table) -> None:
+        """Cache table, evicting least recently used tables over max_bytes."""
+        nbytes = self.NBytes(table)
+        if nbytes > self.max_bytes:
+            logging.debug(f"TableCache.too_large[{key}]: {nbytes}")
+            return
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (table, nbytes)
+            self.nbytes += nbytes
+            while self.nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+
+    def get_or_load(self, key: Hashable, load: Callable[[], object]):
+        """Return the cached table, calling `load` (outside the lock) on a miss."""
+        table = self.get(key)
+        if table is None:
+            table = load()
+            self.put(key, table)
+        return table
+
+    def _pop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[1]
+
+    def discard_path(self, path: str) -> None:
+        """Drop tables read from path (keys are `(hash, path)`)."""
+        with self._lock:
+            for key in [k for k in self._entries if k[-1] == path]:  # type: ignore
+                self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
@@ -1,18 +1,27 @@
+import asyncio
 import logging  # noqa: F401
 import json
+import os
+import shutil
 
 import pyarrow as pa  # type: ignore
 import pyarrow.parquet as pq  # type: ignore
 
+from copy import copy, deepcopy
+from dataclasses import replace
 from pathlib import Path
 from pyarrow.parquet import ParquetFile
 from typing import Iterator
 
+from ..config.blobstore import BlobStore
+from ..config.hashcache import HashCache
 from .codec import Codec
 from .header import Header
 from .keyed import Keyed
+from .pool import Budget, Pool
+from .tablecache import TableCache
 from .types import Dict3, Dict4, List4, Types
-from .verifiable import Verifiable
+from .verifiable import Verifiable, VerifyDict
 
 from jsonlines import Writer  # type: ignore
 
@@ -27,6 +36,23 @@ class Tabular(Keyed):
     """
 
     EXT4 = ".parquet"
+    K_BATCH_SIZE = "batch_size"
+    K_BLOBS = "blobs"
+    K_FOOTER = "header_in_footer"
+    K_HASH = "hash"
+    K_HASH_CACHE = "hash_cache"
+    K_INCREMENTAL = "incremental"
+    K_LAZY_JSON = "lazy_json"
+    K_LINK = "link"
+    K_MAX_BYTES = "max_bytes"
+    K_PARQUET = "parquet"
+    K_PART_SIZE = "part_size"
+    K_RANGED = "ranged"
+    K_NAME = "name"
+    K_RELAX = "relax"
+    K_SORT = "sort_by_name"
+    K_THRESHOLD = "threshold"
+    FOOTER_KEY = b"quilt.header"
     REL_PATH = "./"
 
     @classmethod
@@ -48,16 +74,64 @@ class Tabular(Keyed):
         return path.name
 
     @classmethod
-    def ReadParquet(cls, path: Path) -> pa.Table:
-        """Read a parquet file into a pa.Table."""
+    def ReadParquet(cls, path: Path, lazy=False) -> pa.Table:
+        """Read a parquet file into a pa.Table (leaving JSON unparsed if lazy)."""
         with path.open(mode="rb") as fi:
             table = ParquetFile(fi).read()
-            return cls.UnparseTable(table)
+            return table if lazy else cls.UnparseTable(table)
+
+    @classmethod
+    def ListTable(cls, list4: List4, default=str) -> pa.Table:
+        """Build a body table from Dict4 rows, one column at a time."""
+        return pa.table(
+            {
+                "name": pa.array([d.name for d in list4], pa.string()),
+                "place": pa.array([d.place for d in list4], pa.string()),
+                "size": pa.array([d.size for d in list4], pa.int64()),
+                "hash": pa.array([d.hash for d in list4], pa.binary()),
+                "multihash": pa.array([d.multihash for d in list4], pa.string()),
+                "workflow": pa.array([d.workflow for d in list4], pa.string()),
+                "info.json": cls.JSONColumn([d.info for d in list4], default),
+                "meta.json": cls.JSONColumn([d.meta for d in list4], default),
+            }
+        )
+
+    @staticmethod
+    def JSONColumn(values: list, default=str) -> pa.Array:
+        dumps = json.JSONEncoder(ensure_ascii=False, default=default).encode
+        return pa.array([dumps(value or {}) for value in values], pa.string())
+
+    @classmethod
+    def WriteJSONL(
+        cls, head3: dict, body: pa.Table, path: Path, codec: Codec | None = None
+    ) -> None:
+        """Write a header and body table as a quilt3 JSONL manifest."""
+        codec = codec or Codec()
+        batch_size = int(codec.get_dict("tabular").get(cls.K_BATCH_SIZE, 65536))
+        logging.debug(f"WriteJSONL[{body.num_rows}]: {path}")
+        TableCache.Shared().discard_path(str(path))
+        head3 = {**head3, cls.K_VERSION: cls.HEADER_V3}
+        with path.open(mode="wb") as fo:
+            header = json.dumps(head3, ensure_ascii=False, default=codec.json_default)
+            fo.write(header.encode("utf-8") + b"\n")
+            for start in range(0, body.num_rows, batch_size):
+                lines = codec.encode_lines(body.slice(start, batch_size))
+                chunks = lines.chunks if isinstance(lines, pa.ChunkedArray) else [lines]
+                for chunk in chunks:
+                    if len(chunk) == 0:
+                        continue
+                    # Write the contiguous UTF-8 data buffer without copying
+                    _, offsets, data = chunk.buffers()
+                    offsets = memoryview(offsets).cast("i")
+                    first = offsets[chunk.offset]
+                    last = offsets[chunk.offset + len(chunk)]
+                    fo.write(memoryview(data)[first:last])
 
     @classmethod
     def WriteJSON(cls, head3: dict, rows: list[Dict3], path: Path) -> None:
         """Write manifest contents to _path_"""
         logging.debug(f"Write3: {path}")
+        TableCache.Shared().discard_path(str(path))
         with path.open(mode="wb") as fo:
             with Writer(fo) as writer:
                 head3[cls.K_VERSION] = cls.HEADER_V3
@@ -73,17 +147,96 @@ class Tabular(Keyed):
                         logging.error(f"WriteJSON.missing_dict: {row}")
 
     @classmethod
-    def WriteParquet(cls, list4: List4, path: Path) -> Path:
-        """Write a list4 to a parquet file."""
+    def WriteParquet(
+        cls, list4: List4, path: Path, codec: Codec | None = None, **options
+    ) -> Path:
+        """
+        Write a list4 (header first) to a parquet file.
+
+        If `sort_by_name`, body rows are sorted by name so row group
+        statistics can prune prefix queries. Since the top hash depends on
+        row order, `tabular/sort_by_name` is applied by `FolderBuilder`
+        before hashing, and existing manifests keep their order.
+
+        If `header_in_footer`, the header is stored as JSON in the file's
+        key/value metadata (under `FOOTER_KEY`) instead of as row 0.
+        """
+        codec = codec or Codec()
+        tabular = codec.get_dict("tabular")
+        sort = options.pop(cls.K_SORT, False)
+        footer = options.pop(cls.K_FOOTER, tabular.get(cls.K_FOOTER))
         parquet_path = cls.ParquetPath(path)
-        list4[0].info[cls.K_VERSION] = cls.HEADER_V4
-        dicts = [dict4.to_parquet_dict() for dict4 in list4]
-        table = pa.Table.from_pylist(dicts)
-        pq.write_table(table, parquet_path)
+        head = replace(list4[0], info={**list4[0].info, cls.K_VERSION: cls.HEADER_V4})
+        if footer:
+            table = cls.ListTable(list4[1:])
+            table = table.sort_by(cls.K_NAME) if sort else table
+            metadata = {cls.FOOTER_KEY: cls.FooterJSON(head, codec)}
+            table = table.replace_schema_metadata(metadata)
+        else:
+            table = cls.ListTable([head] + list4[1:])
+            if sort:
+                body = table.slice(1).sort_by(cls.K_NAME)
+                table = pa.concat_tables([table.slice(0, 1), body])
+        cls.WriteTable(table, parquet_path, codec, **options)
         return parquet_path
 
+    @classmethod
+    def FooterJSON(cls, head: Dict4, codec: Codec | None = None) -> bytes:
+        """Encode a header Dict4 (minus its raw hash) for parquet metadata."""
+        codec = codec or Codec()
+        head_dict = head.to_dict()
+        del head_dict[cls.K_HASH]
+        text = json.dumps(head_dict, ensure_ascii=False, default=codec.json_default)
+        return text.encode("utf-8")
+
+    @classmethod
+    def FooterHead(cls, metadata: dict | None) -> Dict4 | None:
+        """Decode the header Dict4 from parquet metadata, if present."""
+        if not metadata or cls.FOOTER_KEY not in metadata:
+            return None
+        return Dict4.V2(**json.loads(metadata[cls.FOOTER_KEY]))
+
+    @classmethod
+    def ParquetOptions(cls, codec: Codec | None = None, **overrides) -> dict:
+        """Merge `tabular/parquet` writer options with caller overrides."""
+        codec = codec or Codec()
+        return {**codec.get_dict(f"tabular/{cls.K_PARQUET}"), **overrides}
+
+    @classmethod
+    def WriteTable(
+        cls,
+        table: pa.Table | dict[str, pa.Array],
+        path: Path,
+        codec: Codec | None = None,
+        **options,
+    ) -> Path:
+        """
+        Write column arrays straight to parquet, using `tabular/parquet`
+        for row group size, compression, encodings and statistics.
+        """
+        if isinstance(table, dict):
+            table = pa.table(table)
+        opts = cls.ParquetOptions(codec, **options)
+        columns = set(table.column_names)
+        for key in ["use_dictionary", "write_statistics"]:
+            if isinstance(opts.get(key), list):
+                opts[key] = [name for name in opts[key] if name in columns]
+        if isinstance(opts.get("column_encoding"), dict):
+            encodings = opts["column_encoding"].items()
+            opts["column_encoding"] = {k: v for k, v in encodings if k in columns}
+        with path.open(mode="wb") as fo:
+            pq.write_table(table, fo, **opts)
+        TableCache.Shared().discard_path(str(path))
+        return path
+
     @staticmethod
-    def ParseColumn(table: pa.Table, field: str) -> pa.Table:
+    def DecodeJSON(json_col: pa.ChunkedArray) -> list:
+        """Decode a column of JSON strings with a single parse of the joined text."""
+        values = (value or "null" for value in json_col.to_pylist())
+        return json.loads("[" + ",".join(values) + "]")
+
+    @staticmethod
+    def ParseColumn(table: pa.Table, field: str, bulk=False) -> pa.Table:
         """Parse JSON column."""
         json_field = f"{field}.json"
         col_id = table.schema.get_field_index(json_field)
@@ -91,19 +244,43 @@ class Tabular(Keyed):
             return table
 
         json_col = table.column(json_field)
-        table = table.append_column(
-            field,
-            pa.array([json.loads(x.as_py()) for x in json_col]),
-        )
+        if bulk:
+            values = Tabular.DecodeJSON(json_col)
+        else:
+            values = [json.loads(x.as_py()) for x in json_col]
+        table = table.append_column(field, pa.array(values))
         return table.remove_column(col_id)
 
     @staticmethod
-    def UnparseTable(table: pa.Table) -> pa.Table:
+    def UnparseTable(table: pa.Table, bulk=False) -> pa.Table:
         """Parse all JSON_FIELDS column."""
         for field in Types.K_JSON_FIELDS:
-            table = Tabular.ParseColumn(table, field)
+            table = Tabular.ParseColumn(table, field, bulk)
         return table
 
+    @staticmethod
+    def ParseRow(row: dict) -> dict:
+        """Parse any still-unparsed JSON_FIELDS of a single row."""
+        for field in Types.K_JSON_FIELDS:
+            json_field = f"{field}.json"
+            if json_field in row:
+                value = row.pop(json_field)
+                row[field] = json.loads(value) if value is not None else None
+        return row
+
+    @staticmethod
+    def ParseRows(table: pa.Table) -> list[dict]:
+        """Convert table to rows, parsing each unparsed JSON column in bulk."""
+        rows = table.to_pylist()
+        for field in Types.K_JSON_FIELDS:
+            json_field = f"{field}.json"
+            if json_field in table.column_names:
+                values = Tabular.DecodeJSON(table.column(json_field))
+                for row, value in zip(rows, values):
+                    del row[json_field]
+                    row[field] = value
+        return rows
+
     #
     # Initialization
     #
@@ -113,8 +290,10 @@ class Tabular(Keyed):
         super().__init__(**kwargs)
         self.path = path
         self.codec = Codec()
+        self.lazy = kwargs.get(self.K_LAZY_JSON, self.option(self.K_LAZY_JSON, False))
         self.store = self.path.parent.parent.parent
         self.table = self._get_table()
+        self._index: dict[str, int] | None = None
         self.header: Header | None = None
         self.head = self._get_head()
         self.body = self._get_body()
@@ -123,6 +302,22 @@ class Tabular(Keyed):
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.path})"
 
+    def __copy__(self) -> "Tabular":
+        """
+        Copy that shares the (immutable) Arrow tables but has its own
+        header, head row, row cache, and Codec (which keeps per-call
+        decoding options), so it can be changed (e.g., by `parse_json`)
+        or read concurrently without affecting other holders of the original.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone._cache = {}
+        clone.codec = Codec(self.codec.scheme)
+        clone.codec.name_col = self.codec.name_col
+        clone.head = deepcopy(self.head)
+        clone.header = copy(self.header)
+        return clone
+
     def __str__(self) -> str:
         return str(self.table)
 
@@ -133,7 +328,14 @@ class Tabular(Keyed):
     def first(self) -> dict:
         heading = self.table.take([0])
         assert heading, f"No heading found for {self.path}:\n${self.table}"
-        return heading.to_pylist()[0]
+        return self.ParseRow(heading.to_pylist()[0])
+
+    def parse_json(self) -> pa.Table:
+        """Decode all lazy JSON columns at once (e.g., before a full scan)."""
+        self.table = self.UnparseTable(self.table, bulk=True)
+        self.body = self._get_body()
+        self._index = None
+        return self.table
 
     def _get_table(self) -> pa.Table:
         raise NotImplementedError
@@ -156,9 +358,50 @@ class Tabular(Keyed):
     def names(self) -> list[str]:
         return list(self._cache.keys())
 
+    def name_column(self) -> pa.ChunkedArray:
+        """Return the column of names that rows are looked up by."""
+        raise NotImplementedError
+
+    def row_index(self, key: str) -> int:
+        """Return the row index for a name, or -1 if missing."""
+        if self._index is None:
+            names = self.name_column().to_pylist()
+            # build in reverse so the first of any duplicate names wins
+            self._index = {name: i for i, name in reversed(list(enumerate(names)))}
+        return self._index.get(key, -1)
+
     def get_dict4(self, key: str) -> Dict4:
         raise NotImplementedError
 
+    def batch_to_list4(self, batch: pa.Table) -> List4:
+        """Convert a slice of the body into Dict4s."""
+        raise NotImplementedError
+
+    def hash_values(self) -> pa.ChunkedArray:
+        """Return the quilt3 hash value (multihash minus prefix) of each body row."""
+        raise NotImplementedError
+
+    def top_hash(self) -> str:
+        """
+        Return the multihash of the header's q3hash followed by every body
+        hash value, as `FolderBuilder` computes it, without building Dict4s.
+        """
+        assert isinstance(self.header, Header), f"No header for {self.path}"
+        header_dict = VerifyDict(self.codec, self.header.hashable_dict())
+        head = header_dict.q3hash().encode("utf-8")
+        return self.codec.digest_strings(head, self.hash_values()).hex()
+
+    def option(self, key: str, default=None):
+        """Return a `tabular` option from the config file."""
+        return self.codec.get_dict("tabular").get(key, default)
+
+    def iter_dict4(self, batch_size: int = 0) -> Iterator[Dict4]:
+        """Yield the header, then every body row as a Dict4, batch by batch."""
+        batch_size = batch_size or int(self.option(self.K_BATCH_SIZE, 1024))
+        yield self.head
+        for offset in range(0, self.body.num_rows, batch_size):
+            yield from self.batch_to_list4(self.body.slice(offset, batch_size))
+
     def _get(self, key: str):
         return self.get_dict4(key)
 
@@ -191,17 +434,291 @@ class Tabular(Keyed):
 
     # Relaxation
 
-    def relax(self, install_dir: Path, source_dir: Path | None = None) -> List4:
-        """Relax each row of this remote Table into local install_dir."""
+    @staticmethod
+    def ThreadPool(params: dict) -> Pool:
+        """
+        Return a one-item-per-task thread Pool for relax `params`.
+
+        Transfers run closures over shared state (e.g., an open file),
+        so they cannot be sent to a process executor.
+        """
+        executor = params.get(Pool.K_EXECUTOR, Pool.THREAD)
+        if executor != Pool.THREAD:
+            raise ValueError(f"relax requires the thread executor, not {executor}")
+        return Pool.FromParams({**params, Pool.K_CHUNK: 1})
+
+    def relax_options(self, **overrides) -> dict:
+        """Merge `tabular/relax` config with caller overrides."""
+        return {**self.codec.get_dict(f"tabular/{self.K_RELAX}"), **overrides}
+
+    def is_unchanged(self, row: Dict4, install_path: Path, opts: dict) -> bool:
+        """
+        True if incremental and install_path already holds row's contents.
+
+        Sizes are compared first, so only same-sized files are hashed;
+        a `hash_cache` skips rehashing files whose stat is unchanged.
+        """
+        if not opts.get(self.K_INCREMENTAL, False):
+            return False
+        store = self.blob_store(row, install_path, opts)
+        if store is not None and store.is_installed(row.multihash, install_path):
+            return True
+        try:
+            stat = install_path.stat()
+        except OSError:
+            return False
+        size = stat.get("size") if isinstance(stat, dict) else stat.st_size
+        if size != row.size:
+            return False
+        cache = opts.get(self.K_HASH_CACHE)
+        if isinstance(cache, HashCache):
+            raw_hash = cache.digest(install_path, self.codec.digest_path)
+        else:
+            raw_hash = self.codec.digest_path(install_path)
+        return raw_hash.hex() == row.multihash
+
+    def blob_store(self, row: Dict4, install_path: Path, opts: dict):
+        """
+        Return the BlobStore to install row through, if enabled, local,
+        and able to share blobs via one of the `link` methods.
+        """
+        store = opts.get(self.K_BLOBS)
+        if not isinstance(store, BlobStore) or not opts.get(self.K_LINK):
+            return None
+        if not store.uses_links(opts[self.K_LINK]):
+            return None
+        if not row.multihash or not self.IsLocalPath(install_path):
+            return None
+        return store
+
+    def save_cache(self, opts: dict) -> None:
+        cache = opts.get(self.K_HASH_CACHE)
+        if isinstance(cache, HashCache):
+            cache.save()
+
+    def relax(
+        self, install_dir: Path, source_dir: Path | None = None, **options
+    ) -> List4:
+        """
+        Relax each row of this remote Table into local install_dir.
+
+        Rows are copied concurrently by a worker Pool,
+        with at most `max_bytes` of file contents in flight.
+        If `incremental`, files already present in install_dir are kept.
+        With a BlobStore (`blobs`), new contents are stored once by multihash
+        and installed by the first `link` method that works.
+        Results are returned in manifest order.
+        """
         install_dir.mkdir(parents=True, exist_ok=True)
-        return [self._relax(row, install_dir / name) for name, row in self.items()]
+        opts = self.relax_options(**options)
+        pool = self.ThreadPool(opts)
+        budget = Budget(int(opts.get(self.K_MAX_BYTES, 0)))
+
+        def admit() -> Iterator[tuple[Dict4, int]]:
+            for row in self.iter_dict4():
+                yield row, budget.acquire(row.size)
+
+        def relax_row(admitted: tuple[Dict4, int]) -> Dict4:
+            row, reserved = admitted
+            try:
+                return self._relax(row, install_dir / row.name, opts)
+            finally:
+                budget.release(reserved)
+
+        list4 = list(pool.map(relax_row, admit()))
+        self.save_cache(opts)
+        return list4
+
+    async def arelax(
+        self, install_dir: Path, source_dir: Path | None = None, **options
+    ) -> List4:
+        """
+        Relax each row into install_dir on the running event loop.
 
-    def _relax(self, row: Dict4, install_path: Path) -> Dict4:
+        At most `workers` rows are transferred at once; rows on async
+        fsspec filesystems (e.g., s3fs) use its native coroutines,
+        while all others are copied in a worker thread.
+        """
+        install_dir.mkdir(parents=True, exist_ok=True)
+        opts = self.relax_options(**options)
+        limit = asyncio.Semaphore(Pool.FromParams(opts).workers)
+        filesystems: dict = {}
+
+        async def relax_row(row: Dict4) -> Dict4:
+            async with limit:
+                install_path = install_dir / row.name
+                return await self._arelax(row, install_path, opts, filesystems)
+
+        try:
+            rows = [relax_row(row) for row in self.iter_dict4()]
+            list4 = list(await asyncio.gather(*rows))
+        finally:
+            await self.CloseFileSystems(filesystems)
+        self.save_cache(opts)
+        return list4
+
+    @staticmethod
+    async def AsyncFileSystem(path: Path, cache: dict):
+        """
+        Return an async fsspec filesystem for path, if any.
+
+        Each is a new (uncached) instance whose session is bound to the
+        running event loop; call `CloseFileSystems` before the loop ends.
+        """
+        fs = getattr(path, "fs", None)
+        if fs is None or not getattr(fs, "async_impl", False):
+            return None
+        key = (type(fs), json.dumps(fs.storage_options, sort_keys=True, default=str))
+        if key not in cache:
+            afs = type(fs)(
+                asynchronous=True, skip_instance_cache=True, **fs.storage_options
+            )
+            session = None
+            if hasattr(afs, "set_session"):
+                session = await afs.set_session()
+            cache[key] = (afs, session)
+        return cache[key][0]
+
+    @staticmethod
+    async def CloseFileSystems(cache: dict) -> None:
+        """Close the sessions opened by `AsyncFileSystem`."""
+        for afs, session in cache.values():
+            close = getattr(session, "close", None)
+            if close is None:
+                continue
+            try:
+                result = close()
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logging.debug(f"CloseFileSystems[{afs}]: {e}")
+        cache.clear()
+
+    async def _arelax(
+        self, row: Dict4, install_path: Path, opts: dict, filesystems: dict
+    ) -> Dict4:
+        """Relax one row, using async fsspec transfers where possible."""
+        if row.name == self.HEADER_NAME:
+            return row
+        if await asyncio.to_thread(self.is_unchanged, row, install_path, opts):
+            return Verifiable.UpdateDict4(row, install_path)
+        remote_path = self.as_path(row.place)
+        source_fs = await self.AsyncFileSystem(remote_path, filesystems)
+        dest_fs = await self.AsyncFileSystem(install_path, filesystems)
+        store = self.blob_store(row, install_path, opts)
+        if source_fs is not None and store is not None:
+            if store.get(row.multihash, row.size) is None:
+                tmp = store.temp_path()
+                try:
+                    await source_fs._get_file(str(remote_path), str(tmp))
+                    await asyncio.to_thread(store.commit, tmp, row.multihash)
+                finally:
+                    tmp.unlink(missing_ok=True)
+            links = opts[self.K_LINK]
+            await asyncio.to_thread(
+                store.install, row.multihash, self.OsPath(install_path), links
+            )
+        elif source_fs is not None and dest_fs is None:
+            install_path.parent.mkdir(parents=True, exist_ok=True)
+            await source_fs._get_file(str(remote_path), str(install_path))
+        elif dest_fs is not None and source_fs is None:
+            await dest_fs._put_file(str(remote_path), str(install_path))
+        else:
+            return await asyncio.to_thread(self._relax, row, install_path, opts)
+        return Verifiable.UpdateDict4(row, install_path)
+
+    def _relax(self, row: Dict4, install_path: Path, opts: dict = {}) -> Dict4:
         """Relax remote_path of each row into local install_path."""
         if row.name == self.HEADER_NAME:
             return row
+        if self.is_unchanged(row, install_path, opts):
+            return Verifiable.UpdateDict4(row, install_path)
         remote_path = self.as_path(row.place)
         assert remote_path.exists(), f"_relax: {remote_path} not found for {row.place}"
-        with remote_path.open("rb") as fi:
-            install_path.write_bytes(fi.read())
+        store = self.blob_store(row, install_path, opts)
+        if store is not None:
+            if store.get(row.multihash, row.size) is None:
+                if self.IsLocalPath(remote_path):
+                    store.add(row.multihash, self.OsPath(remote_path))
+                else:
+                    tmp = store.temp_path()
+                    try:
+                        verified = self._fetch(row, remote_path, tmp, opts)
+                        store.commit(tmp, row.multihash, verified)
+                    finally:
+                        tmp.unlink(missing_ok=True)
+            store.install(row.multihash, self.OsPath(install_path), opts[self.K_LINK])
+            return Verifiable.UpdateDict4(row, install_path)
+        install_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.IsLocalPath(remote_path) and self.IsLocalPath(install_path):
+            BlobStore.Copy(self.OsPath(remote_path), self.OsPath(install_path))
+        else:
+            self._fetch(row, remote_path, install_path, opts)
         return Verifiable.UpdateDict4(row, install_path)
+
+    def _fetch(self, row: Dict4, remote_path: Path, dest: Path, opts: dict) -> bool:
+        """
+        Download remote_path into dest, in parallel ranges if it is large.
+
+        Returns True if dest was verified against row.multihash on the way.
+        """
+        ranged = opts.get(self.K_RANGED, {})
+        threshold = int(ranged.get(self.K_THRESHOLD, 0))
+        if (
+            threshold
+            and row.size >= threshold
+            and hasattr(os, "pwrite")
+            and self.IsLocalPath(dest)
+        ):
+            self._fetch_ranges(row, remote_path, dest, ranged)
+            return bool(row.multihash)
+        block_size = int(opts.get(self.codec.MH_BLK, self.codec.block_size()))
+        with remote_path.open("rb") as fi, dest.open("wb") as fo:
+            shutil.copyfileobj(fi, fo, block_size)
+        return False
+
+    def _fetch_ranges(
+        self, row: Dict4, remote_path: Path, dest: Path, ranged: dict
+    ) -> None:
+        """
+        Fetch `part_size` byte ranges concurrently with fsspec `cat_file`,
+        writing each in place with pwrite.
+
+        Parts are hashed in order as the Pool yields them. dest is removed
+        if any part fails or the result does not match row.multihash.
+        """
+        part_size = int(ranged[self.K_PART_SIZE])
+        spans = [
+            (start, min(start + part_size, row.size))
+            for start in range(0, row.size, part_size)
+        ]
+        fs = getattr(remote_path, "fs")
+        source = getattr(remote_path, "path", str(remote_path))
+        hasher = self.codec.hasher()
+        fd = os.open(self.OsPath(dest), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, row.size)
+
+            def fetch(span: tuple[int, int]) -> bytes:
+                start, end = span
+                data = fs.cat_file(source, start=start, end=end)
+                if len(data) != end - start:
+                    raise OSError(f"_fetch_ranges.short_read[{start}:{end}]: {source}")
+                view = memoryview(data)
+                while view:
+                    written = os.pwrite(fd, view, start)
+                    view, start = view[written:], start + written
+                return data
+
+            pool = self.ThreadPool(ranged)
+            for data in pool.map(fetch, spans):
+                hasher.update(data)
+        except BaseException:
+            dest.unlink(missing_ok=True)
+            raise
+        finally:
+            os.close(fd)
+        digest = self.codec.digester().wrap(hasher.digest()).hex()
+        if row.multihash and digest != row.multihash:
+            dest.unlink(missing_ok=True)
+            raise ValueError(f"_fetch_ranges.mismatch[{source}]: {digest}")
@@ -29,8 +29,11 @@ class Types:
     K_UVER = "VersionId"
     K_VER = "versionId"
     K_VERSION = "version"
+    MH_BLK = "block_size"
     MH_DIG = "digest"
+    MH_MAP = "mmap"
     MH_PRE = "prefix"
+    MH_STR = "stream"
     SIZE = 0
     T_HSH = "is_hash"
     T_LST = "is_list"
@@ -68,6 +71,23 @@ class Types:
             key = key.replace(drives[0], drives[1] + ":")
         return UPath(key).absolute()  # , version_aware=True
 
+    @staticmethod
+    def IsLocalPath(path: Path) -> bool:
+        """True for plain or local-filesystem (file://) paths."""
+        return getattr(path, "protocol", "") in ("", "file", "local")
+
+    @classmethod
+    def OsPath(cls, path: Path) -> Path:
+        """
+        Return a local path that builtin `open` and `os` functions accept.
+
+        `os.fspath` of a file:// UPath keeps its scheme ("file:/..."),
+        so those are converted to a plain Path of their `path`.
+        """
+        if getattr(path, "protocol", "") in ("file", "local"):
+            return Path(getattr(path, "path"))
+        return path
+
     @staticmethod
     def RelativePath(path: Path, base: Path) -> Path:
         """Return a relative path, if inside base."""
@@ -1,7 +1,10 @@
+import io
 import logging
 from pathlib import Path
 from os import stat_result
+from typing import BinaryIO
 
+from ..config.hashcache import HashCache
 from .codec import Codec, Dict4, Multihash
 from .keyed import Keyed
 
@@ -36,6 +39,7 @@ class Verifiable(Keyed):
         super().__init__(**kwargs)
         self.cf = codec
         self._hash: Multihash | None = None
+        self.hash_cache: HashCache | None = None
 
     #
     # Hashable Bytes
@@ -79,12 +83,31 @@ class Verifiable(Keyed):
         """Hash `input` bytes using the current codec."""
         return self.cf.digest(input)
 
+    def digest_stream(self, stream: BinaryIO) -> Multihash:
+        """Hash a binary stream in fixed-size blocks using the current codec."""
+        return self.cf.digest_stream(stream).hex()
+
+    def digest_path(self, path: Path) -> Multihash:
+        """Hash a file's contents without loading it all into memory."""
+        return self.cf.digest_path(path).hex()
+
     def _multihash_contents(self) -> Multihash:
         """Calculate the multihash for this object's bytes."""
+        if path := self.hashable_path():
+            return self.digest_path(path)
         return self.digest_bytes(self.to_bytes())
 
+    def cached_digest(self, path: Path) -> bytes:
+        """Return raw multihash of a file, reusing hash_cache if unchanged."""
+        if self.hash_cache is None:
+            return self.cf.digest_path(path)
+        return self.hash_cache.digest(path, self.cf.digest_path)
+
     def dict4_from_path(self, path: Path) -> Dict4:
-        raw_hash = self.cf.digest_raw(path.read_bytes())
+        return self.dict4_from_hash(path, self.cached_digest(path))
+
+    def dict4_from_hash(self, path: Path, raw_hash: bytes) -> Dict4:
+        """Create Dict4 for a file whose multihash was already calculated."""
         base = Dict4(
             name=path.name,
             place="",
@@ -118,9 +141,14 @@ class Verifiable(Keyed):
         source = self.hashable_dict()
         return Codec.EncodeDict(source)
 
-    def verify(self, contents: bytes) -> bool:
-        """Verify that multihash digest of bytes match the current multihash"""
-        digest = self.digest_bytes(contents)
+    def verify(self, contents: bytes | Path | BinaryIO) -> bool:
+        """Verify that multihash digest of contents match the current multihash"""
+        if isinstance(contents, Path):
+            digest = self.digest_path(contents)
+        elif hasattr(contents, "read"):
+            digest = self.digest_stream(contents)  # type: ignore
+        else:
+            digest = self.digest_bytes(contents)  # type: ignore
         logging.debug(f"verify.digest: {digest}")
         return digest == self.hashify()
 
@@ -132,3 +160,58 @@ class VerifyDict(Verifiable):
 
     def hashable_dict(self) -> dict:
         return self.dict
+
+
+class VerifyingReader(io.RawIOBase):
+    """
+    Read-only binary stream that hashes bytes as they are read.
+
+    When `size` bytes have been read (or the underlying stream reaches EOF),
+    the digest is compared against `multihash` and a ValueError is raised
+    on mismatch. `readinto` fills caller-supplied buffers without extra copies.
+    """
+
+    def __init__(
+        self, raw: BinaryIO, codec: Codec, multihash: Multihash, size: int | None = None
+    ):
+        super().__init__()
+        self.raw = raw
+        self.codec = codec
+        self.multihash = multihash
+        self.size = size
+        self.position = 0
+        self.hasher = codec.hasher()
+        self.verified = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer).cast("B")
+        if hasattr(self.raw, "readinto"):
+            n = self.raw.readinto(view) or 0
+        else:
+            chunk = self.raw.read(len(view))
+            n = len(chunk)
+            view[:n] = chunk
+        if n:
+            self.hasher.update(view[:n])
+            self.position += n
+            if self.size is not None and self.position >= self.size:
+                self._verify()
+        elif len(view) and not self.verified:
+            self._verify()
+        return n
+
+    def _verify(self) -> None:
+        if self.size is not None and self.position > self.size:
+            raise ValueError(f"VerifyingReader.too_long: {self.position} > {self.size}")
+        digest = self.codec.digester().wrap(self.hasher.digest()).hex()
+        if digest != self.multihash:
+            raise ValueError(f"VerifyingReader.mismatch: {digest} != {self.multihash}")
+        self.verified = True
+
+    def close(self) -> None:
+        if not self.closed:
+            self.raw.close()
+        super().close()
@@ -1,20 +1,48 @@
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from uuid import uuid4
 
 import numpy as np
 import pandas as pd
+import jsonlines  # type: ignore
 import pyarrow as pa  # type: ignore
 import pyarrow.json as pj  # type: ignore
 import pyarrow.parquet as pq  # type: ignore
 import pytest  # noqa: F401
+from upath import UPath
 
-from quiltcore import Table3, Table4, Dict4
+from quiltcore import BlobStore, Codec, Dict4, Header, Pool, Table3, Table4
 
 from .conftest import TEST_MAN, TEST_PARQUET
 
 test_file = "tests/test.parquet"
 
 
+def write_manifest3(path: Path, n_rows: int, key_every: int = 0) -> Path:
+    """
+    Write a synthetic quilt3 manifest with `n_rows` entries
+    (changing the `user_meta` key every `key_every` rows, if set).
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    def key(i: int) -> str:
+        return f"k{i // key_every}" if key_every else "i"
+
+    with jsonlines.open(path, mode="w") as writer:
+        writer.write({"version": "v0", "message": "synthetic", "user_meta": {}})
+        for i in range(n_rows):
+            writer.write(
+                {
+                    "logical_key": f"dir/file {i}.txt",
+                    "physical_keys": [f"s3://bucket/dir/file%20{i}.txt"],
+                    "size": i,
+                    "hash": {"type": "SHA256", "value": f"{i:064x}"},
+                    "meta": {"user_meta": {key(i): i}} if i % 2 else {},
+                }
+            )
+    return path
+
+
 def test_arrow_pandas():
     df = pd.DataFrame(
         {
@@ -120,3 +148,311 @@ def test_arrow_relax():
         entry = table4["ONLYME.md"]
         assert entry
         assert entry.name == "ONLYME.md"
+
+
+def test_arrow_relax_file_uri():
+    table3 = Table3(Table3.AsPath(TEST_MAN))
+    codec = Codec()
+    data = b"file uri contents"
+    with TemporaryDirectory() as tmpdirname:
+        root = Path(tmpdirname)
+        src = root / "src.txt"
+        src.write_bytes(data)
+        multihash = codec.digest(data)
+        store = BlobStore(root / "objects", codec.digest_path)
+        for opts in [{}, {Table3.K_BLOBS: store, Table3.K_LINK: ["hardlink"]}]:
+            row = Dict4(
+                name="src.txt",
+                place=src.as_uri(),
+                size=len(data),
+                hash=None,
+                multihash=multihash,
+                info={},
+                meta={},
+            )
+            dest = UPath((root / "out" / uuid4().hex).as_uri())
+            assert dest.protocol == "file"
+            table3._relax(row, dest, opts)
+            assert dest.read_bytes() == data
+            assert codec.digest_path(dest).hex() == multihash
+        assert store.get(multihash, len(data)) is not None
+
+
+def test_arrow_row_index():
+    table3 = Table3(Table3.AsPath(TEST_MAN))
+    assert table3.row_index("ONLYME.md") == 0
+    assert table3.row_index("missing") == -1
+    with pytest.raises(ValueError):
+        table3.get_dict3("missing")
+
+    table4 = Table4(Table4.AsPath(TEST_PARQUET))
+    assert table4.row_index(Table4.HEADER_NAME) == 0
+    assert table4.row_index("ONLYME.md") == 1
+    assert table4.get_row("missing") == {}
+    for name in table4.names():
+        assert table4.get_dict4(name).name == name
+
+
+@pytest.mark.parametrize("klass,path", [(Table3, TEST_MAN), (Table4, TEST_PARQUET)])
+def test_arrow_iter_dict4(klass, path):
+    table = klass(klass.AsPath(path))
+    list4 = list(table.iter_dict4(batch_size=1))
+    assert len(list4) == len(table)
+    assert list4[0] == table.head
+    for dict4 in list4:
+        assert isinstance(dict4, Dict4)
+        assert dict4 == table.get_dict4(dict4.name)
+
+
+def test_arrow_iter_dict4_rows():
+    with TemporaryDirectory() as tmpdirname:
+        path = write_manifest3(Path(tmpdirname) / ".quilt/packages/1234", 10)
+        table3 = Table3(path)
+        list4 = list(table3.iter_dict4(batch_size=3))
+        assert len(list4) == 11
+        assert list4[1].place == "s3://bucket/dir/file 0.txt"
+        assert list4[2].meta == {"i": 1}
+        assert list4[3].multihash == Table3.MULTIHASH + f"{2:064x}"
+        for dict4 in list4[1:]:
+            assert dict4 == table3.get_dict4(dict4.name)
+
+
+def test_arrow_scan():
+    with TemporaryDirectory() as tmpdirname:
+        path = Path(tmpdirname) / "scan.parquet"
+        rows = [
+            Dict4.V2(
+                name=f"{dir}/file{i}.txt",
+                place=f"s3://bucket/{dir}/file{i}.txt",
+                size=i,
+                multihash=Table4.MULTIHASH + f"{i:064x}",
+                info={"i": i},
+                meta={},
+            ).to_parquet_dict()
+            for dir in ["a", "b", "c"]
+            for i in range(4)
+        ]
+        pq.write_table(pa.Table.from_pylist(rows), path, row_group_size=4)
+        metadata = pq.read_metadata(path)
+        assert metadata.num_row_groups == 3
+        b_group = metadata.row_group(1)
+        assert Table4.RowGroupMatches(b_group, prefix="b/")
+        assert not Table4.RowGroupMatches(b_group, prefix="a/")
+        assert not Table4.RowGroupMatches(b_group, min_size=10)
+
+        names = Table4.Scan(path, ["name"], prefix="b/")
+        assert names.column_names == ["name"]
+        assert names.column("name").to_pylist() == [f"b/file{i}.txt" for i in range(4)]
+
+        sized = Table4.Scan(path, ["name", "info"], min_size=1, max_size=2)
+        assert sized.num_rows == 6
+        assert sized.column("info").to_pylist()[0] == {"i": 1}
+        assert Table4.Scan(path, ["size"], min_size=10).num_rows == 0
+        with pytest.raises(KeyError):
+            Table4.Scan(path, ["missing"])
+
+
+def test_arrow_lazy_json():
+    path = Table4.AsPath(TEST_PARQUET)
+    table4 = Table4(path, lazy_json=True)
+    assert table4.lazy
+    assert "info.json" in table4.table.column_names
+    assert "info" not in table4.table.column_names
+    assert table4.head.meta["Author"] == "Ernest"
+
+    entry = table4.get_dict4("ONLYME.md")
+    assert isinstance(entry.info, dict)
+    assert entry.info["tombstone"] is False
+    assert entry.meta == {}  # no null-filled keys from sibling rows
+    assert list(table4.iter_dict4())[1] == entry
+
+    table = table4.parse_json()
+    assert "info" in table.column_names
+    assert "info.json" not in table.column_names
+    assert table4.get_dict4("ONLYME.md").info["tombstone"] is False
+    assert Table4.DecodeJSON(pa.chunked_array([['{"a":1}', None]])) == [{"a": 1}, None]
+
+
+def test_arrow_stream3():
+    with TemporaryDirectory() as tmpdirname:
+        path = write_manifest3(Path(tmpdirname) / ".quilt/packages/1234", 200)
+        table3 = Table3(path)
+        streamed = list(Table3.IterDict4(path, block_size=1024))
+        assert len(streamed) == 201
+        assert streamed[0].info == table3.head.info
+        assert streamed[1:] == list(table3.iter_dict4())[1:]
+
+        empty = write_manifest3(Path(tmpdirname) / ".quilt/packages/5678", 0)
+        assert len(list(Table3.IterDict4(empty))) == 1
+
+        changing = write_manifest3(
+            Path(tmpdirname) / ".quilt/packages/9abc", 2000, key_every=500
+        )
+        streamed = list(Table3.IterDict4(changing, block_size=4096))
+        eager = list(Table3(changing).iter_dict4())
+        assert len(streamed) == len(eager) == 2001
+
+        def set_keys(dict4: Dict4) -> dict:  # structs null-fill sibling keys
+            return {k: v for k, v in (dict4.meta or {}).items() if v is not None}
+
+        assert [set_keys(d) for d in streamed] == [set_keys(d) for d in eager]
+        assert set_keys(streamed[2000]) == {"k3": 1999}
+
+
+def test_arrow_schema3():
+    with TemporaryDirectory() as tmpdirname:
+        path = write_manifest3(Path(tmpdirname) / ".quilt/packages/1234", 0)
+        table3 = Table3(path)
+        schema = table3.codec.arrow_schema()
+        assert "meta" not in schema.names  # open-ended struct is still inferred
+        for field in schema:
+            assert table3.table.schema.field(field.name).type == field.type
+        assert table3.body.num_rows == 0
+        assert table3.names() == [Table3.HEADER_NAME]
+
+
+def test_arrow_ranged():
+    table3 = Table3(Table3.AsPath(TEST_MAN))
+    data = bytes(range(256)) * 1000
+    remote = UPath(f"memory://ranged/{uuid4().hex}.bin")
+    remote.write_bytes(data)
+    multihash = table3.codec.digest(data)
+    row = Dict4.V2(
+        name="big.bin",
+        place=str(remote),
+        size=len(data),
+        multihash=multihash,
+        info={},
+        meta={},
+    )
+    ranged = {
+        Table3.K_THRESHOLD: 1,
+        Table3.K_PART_SIZE: 10_000,
+        Pool.K_WORKERS: 4,
+        Pool.K_QUEUE: 3,
+    }
+    with TemporaryDirectory() as tmpdirname:
+        dest = Path(tmpdirname) / "big.bin"
+        table3._fetch(row, remote, dest, {Table3.K_RANGED: ranged})
+        assert dest.read_bytes() == data
+
+        row.multihash = table3.codec.digest(b"other")
+        with pytest.raises(ValueError):
+            table3._fetch(row, remote, dest, {Table3.K_RANGED: ranged})
+        assert not dest.exists()
+
+        row.size = len(data) + 1  # last part comes back short
+        with pytest.raises(OSError):
+            table3._fetch(row, remote, dest, {Table3.K_RANGED: ranged})
+        assert not dest.exists()
+
+
+def test_arrow_write_table():
+    list4 = [Header.HeaderDict4("write table")] + [
+        Dict4.V2(
+            name=f"dir/file{i}.txt",
+            place=f"s3://bucket/dir/file{i}.txt",
+            size=i,
+            multihash=Table4.MULTIHASH + f"{i:064x}",
+            info={"i": i},
+            meta={},
+        )
+        for i in range(10)
+    ]
+    with TemporaryDirectory() as tmpdirname:
+        path = Table4.WriteParquet(list4, Path(tmpdirname) / "x", row_group_size=4)
+        metadata = pq.read_metadata(path)
+        assert metadata.num_row_groups == 3
+        columns = metadata.row_group(1).to_dict()["columns"]
+        by_name = {column["path_in_schema"]: column for column in columns}
+        assert by_name["name"]["compression"] == "ZSTD"
+        assert "DELTA_BYTE_ARRAY" in by_name["place"]["encodings"]
+        assert by_name["name"]["statistics"]["min"] == "dir/file3.txt"
+        assert by_name["place"]["statistics"] is None
+        assert metadata.row_group(0).column(0).has_column_index
+
+        table4 = Table4(path)
+        assert table4.head.info["message"] == "write table"
+        assert table4["dir/file3.txt"].info["i"] == 3
+        names = Table4.Scan(path, ["name"], prefix="dir/file9")
+        assert names.column("name").to_pylist() == ["dir/file9.txt"]
+
+        arrays = {"name": pa.array(["a"]), "size": pa.array([1])}
+        direct = Table4.WriteTable(arrays, Path(tmpdirname) / "direct.parquet")
+        assert pq.read_table(direct).column_names == ["name", "size"]
+
+
+def test_arrow_scan_dir():
+    names = [f"{dir}/file{i}.txt" for i in range(3) for dir in ["c", "a/x", "b", "a"]]
+    list4 = [Header.HeaderDict4("sorted")] + [
+        Dict4.V2(
+            name=name,
+            place=f"s3://bucket/{name}",
+            size=len(name),
+            multihash=Table4.MULTIHASH + f"{i:064x}",
+            info={},
+            meta={},
+        )
+        for i, name in enumerate(names)
+    ]
+    with TemporaryDirectory() as tmpdirname:
+        unsorted = Table4.WriteParquet(list4, Path(tmpdirname) / "unsorted")
+        assert Table4(unsorted).names()[1:] == names
+
+        path = Table4.WriteParquet(
+            list4, Path(tmpdirname) / "sorted", sort_by_name=True, row_group_size=3
+        )
+        table4 = Table4(path)
+        assert table4.head.info["message"] == "sorted"
+        assert table4.names()[1:] == sorted(names)
+        metadata = pq.read_metadata(path)
+        matching = [
+            i
+            for i in range(metadata.num_row_groups)
+            if Table4.RowGroupMatches(metadata.row_group(i), prefix="b/")
+        ]
+        assert metadata.num_row_groups == 5
+        assert matching == [2, 3]  # of 5, since b/* rows are contiguous
+
+        under_a = Table4.ScanDir(path, "a", ["name", "size"])
+        assert under_a.column_names == ["name", "size"]
+        expected = sorted(n for n in names if n.startswith("a/"))
+        assert under_a.column("name").to_pylist() == expected
+        assert Table4.ScanDir(path, "a/x/", ["size"]).num_rows == 3
+        assert Table4.ScanDir(path, "").num_rows == len(names)
+
+
+def test_arrow_header_footer():
+    head = Header.HeaderDict4("footer", user_meta={"Author": "Ernest"})
+    list4 = [head] + [
+        Dict4.V2(
+            name=f"file{i}.txt",
+            place=f"s3://bucket/file{i}.txt",
+            size=i,
+            multihash=Table4.MULTIHASH + f"{i:064x}",
+            info={},
+            meta={"i": i},
+        )
+        for i in range(4)
+    ]
+    with TemporaryDirectory() as tmpdirname:
+        legacy = Table4.WriteParquet(list4, Path(tmpdirname) / "legacy")
+        assert Table4.ReadHeader(legacy) is None
+        path = Table4.WriteParquet(
+            list4, Path(tmpdirname) / "footer", header_in_footer=True
+        )
+        assert pq.read_metadata(path).num_rows == 4
+
+        footer = Table4.ReadHeader(path)
+        assert footer is not None
+        assert footer.info["message"] == "footer"
+        assert footer.meta["Author"] == "Ernest"
+
+        for loaded in [Table4(legacy), Table4(path)]:
+            assert loaded.head.info["message"] == "footer"
+            assert loaded.header.hashable_dict()["user_meta"]["Author"] == "Ernest"
+            assert loaded.body.num_rows == 4
+            assert loaded.names()[0] == Table4.HEADER_NAME
+            assert loaded["file2.txt"].meta["i"] == 2
+            assert loaded[Table4.HEADER_NAME].info["message"] == "footer"
+            assert [d.name for d in loaded.iter_dict4()] == loaded.names()
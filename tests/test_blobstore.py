@@ -0,0 +1,73 @@
+import io
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from pytest import fixture, raises
+
+from quiltcore import BlobStore, Codec
+
+CODEC = Codec()
+DATA = b"blob contents"
+MH = CODEC.digest(DATA)
+
+
+@fixture
+def store():
+    with TemporaryDirectory() as tmpdirname:
+        yield BlobStore(Path(tmpdirname) / "objects", CODEC.digest_path)
+
+
+def test_blob_add(store: BlobStore):
+    assert MH not in store
+    assert store.get(MH) is None
+    blob = store.add(MH, io.BytesIO(DATA), 4)
+    assert MH in store
+    assert blob == store.path(MH)
+    assert blob.read_bytes() == DATA
+    assert not os.access(blob, os.W_OK) or os.geteuid() == 0
+    assert store.get(MH, len(DATA)) == blob
+    assert store.get(MH, len(DATA) + 1) is None
+    assert not list((store.dir / BlobStore.TMP_DIR).iterdir())
+
+    with raises(ValueError):
+        store.add(MH, io.BytesIO(DATA.upper()))
+    assert store.path(MH).read_bytes() == DATA
+    assert not list((store.dir / BlobStore.TMP_DIR).iterdir())
+
+
+def test_blob_install(store: BlobStore):
+    store.add(MH, io.BytesIO(DATA))
+    dest = store.dir.parent / "pkg" / "sub" / "file.txt"
+    method = store.install(MH, dest, ["reflink", "hardlink", "copy"])
+    assert method in ("reflink", "hardlink")
+    assert dest.read_bytes() == DATA
+    assert store.is_installed(MH, dest) == (method == "hardlink")
+
+    copy = dest.with_name("copy.txt")
+    assert store.install(MH, copy, ["copy"]) == "copy"
+    assert not store.is_installed(MH, copy)
+    assert copy.read_bytes() == DATA
+    assert sorted(p.name for p in dest.parent.iterdir()) == ["copy.txt", "file.txt"]
+
+    with raises(OSError):
+        store.install("1220" + "cd" * 32, dest, ["hardlink", "copy"])
+    assert dest.read_bytes() == DATA
+
+
+def test_blob_copy(store: BlobStore):
+    store.dir.mkdir(parents=True)
+    for data in [b"", DATA, DATA * 100_000]:
+        src, dest = store.dir / "src", store.dir / "dest"
+        src.write_bytes(data)
+        BlobStore.Copy(src, dest)
+        assert dest.read_bytes() == data
+        blob = store.add(CODEC.digest(data), src)
+        assert blob.read_bytes() == data
+
+
+def test_blob_uses_links(store: BlobStore):
+    assert not store.uses_links(["copy"])
+    assert store.uses_links(["hardlink", "copy"])
+    assert store.uses_links(["reflink", "copy"]) == store.can_reflink()
+    assert not list((store.dir / BlobStore.TMP_DIR).iterdir())  # probe cleaned up
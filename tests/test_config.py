@@ -1,3 +1,5 @@
+import pyarrow as pa  # type: ignore
+
 from quiltcore import Codec, Config, Hash3
 
 
@@ -56,3 +58,15 @@ def test_cf_encode():
 
     codec.check_opts({codec.T_LST: True})
     assert codec.encode_value(TEST_STR) == [TEST_STR]
+
+
+def test_cf_decode_column():
+    codec = Codec()
+    names = pa.chunked_array([["a.txt", "b c.txt"], ["d.txt"]])
+    name_opts = codec.coding["logical_key"]
+    assert codec.decode_column(names, name_opts) is names
+
+    places = pa.chunked_array([[["s3://b/READ%20ME.md"], ["s3://b/x.md"]], [[None]]])
+    place_opts = codec.coding["physical_keys"]
+    decoded = codec.decode_column(places, place_opts)
+    assert decoded.to_pylist() == ["s3://b/READ ME.md", "s3://b/x.md", None]
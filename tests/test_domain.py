@@ -1,9 +1,24 @@
+import asyncio
+from types import SimpleNamespace
 from tempfile import TemporaryDirectory
 from pathlib import Path
 import os
+from shutil import copytree
 import pytest
-
-from quiltcore import UDI, Domain, Manifest, Scheme, quilt
+from fsspec.asyn import AsyncFileSystem
+
+from quiltcore import (
+    UDI,
+    Domain,
+    FolderBuilder,
+    Manifest,
+    Pool,
+    Scheme,
+    Table4,
+    Tabular,
+    VersionLog,
+    quilt,
+)
 
 from .conftest import LOCAL_UDI, LOCAL_URI, LOCAL_VOL, TEST_HASH, TEST_PKG, not_win
 
@@ -130,6 +145,35 @@ def test_dom_build(committed: Domain):
     assert builder
 
 
+def test_dom_build_parallel(domain: Domain):
+    local_path = domain.package_path(TEST_PKG)
+    for i in range(20):
+        (local_path / f"file{i}.txt").write_text(f"{MESSAGE} {i}")
+    serial = FolderBuilder(local_path, domain)
+    serial.params = {**serial.params, Pool.K_WORKERS: 1}
+    parallel = FolderBuilder(local_path, domain)
+    parallel.params = {**parallel.params, Pool.K_WORKERS: 4, Pool.K_CHUNK: 3}
+    assert serial.commit(MESSAGE) == parallel.commit(MESSAGE)
+    assert serial.list4() == parallel.list4()
+
+
+def test_dom_build_cached(domain: Domain):
+    local_path = domain.package_path(TEST_PKG)
+    for i in range(5):
+        file = local_path / f"file{i}.txt"
+        file.write_text(f"{MESSAGE} {i}")
+        os.utime(file, (1, 1))
+    first = domain.build(local_path, message=MESSAGE)
+    cache = domain.hash_cache
+    assert cache.path.exists()
+    assert len(cache) == 5
+    assert cache.hits == 0
+
+    second = domain.build(local_path, message=MESSAGE)
+    assert cache.hits == 5
+    assert first.hashify() == second.hashify()
+
+
 def test_dom_commit(committed: Domain):
     assert committed.path.exists()
     assert isinstance(committed, Domain)
@@ -193,6 +237,23 @@ def test_dom_unpull(committed: Domain):
         assert MESSAGE in first.read_text()
 
 
+def test_dom_pull_concurrent(committed: Domain):
+    local_path = committed.package_path(TEST_PKG)
+    for i in range(10):
+        (local_path / f"file{i}.txt").write_text(f"{MESSAGE} {i}")
+    committed.commit(local_path, message=MESSAGE, package=TEST_PKG)
+    source_udi = committed.get_udi(TEST_PKG)
+    relax = {Pool.K_WORKERS: 4, Tabular.K_MAX_BYTES: 64, Tabular.MH_BLK: 7}
+    for local in make_domain():
+        local.pull(source_udi, relax=relax)
+        pulled = local.package_path(TEST_PKG)
+        for i in range(10):
+            assert (pulled / f"file{i}.txt").read_text() == f"{MESSAGE} {i}"
+
+        with pytest.raises(ValueError, match="thread"):
+            local.pull(source_udi, relax={Pool.K_EXECUTOR: "process"})
+
+
 def test_dom_push(committed: Domain):
     local_path = committed.package_path(TEST_PKG)
     assert local_path.exists()
@@ -211,3 +272,239 @@ def test_dom_push(committed: Domain):
         remote_readme = remote_path / "README.md"
         assert remote_readme.exists()
         assert remote_readme.read_text() == MESSAGE
+
+
+def test_dom_apull(committed: Domain):
+    source_udi = committed.get_udi(TEST_PKG)
+    for local in make_domain():
+        asyncio.run(local.apull(source_udi, relax={Pool.K_WORKERS: 2}))
+        assert TEST_PKG in local
+        first = FirstFile(local.package_path(TEST_PKG))
+        assert MESSAGE in first.read_text()
+
+
+def test_dom_apush(committed: Domain):
+    local_path = committed.package_path(TEST_PKG)
+    for remote in make_domain():
+        remote_udi = remote.get_udi(TEST_PKG)
+        asyncio.run(committed.apush(local_path, remote=remote_udi))
+        remote_readme = remote.package_path(TEST_PKG) / TEST_FILE
+        assert remote_readme.read_text() == MESSAGE
+        assert asyncio.run(Tabular.AsyncFileSystem(remote_readme, {})) is None
+
+
+class SessionFileSystem(AsyncFileSystem):
+    """Async filesystem stub whose session records being closed."""
+
+    async def set_session(self):
+        self.session = SimpleNamespace(closed=False)
+
+        async def close():
+            self.session.closed = True
+
+        self.session.close = close
+        return self.session
+
+
+def test_dom_async_fs():
+    path = SimpleNamespace(fs=SessionFileSystem())
+
+    async def open_and_close():
+        cache: dict = {}
+        afs = await Tabular.AsyncFileSystem(path, cache)
+        assert afs is await Tabular.AsyncFileSystem(path, cache)
+        await Tabular.CloseFileSystems(cache)
+        assert not cache
+        return afs
+
+    first = asyncio.run(open_and_close())
+    second = asyncio.run(open_and_close())
+    assert first is not second  # not shared across event loops
+    assert first.session.closed and second.session.closed
+
+
+def test_dom_pull_incremental(committed: Domain):
+    local_path = committed.package_path(TEST_PKG)
+    for i in range(3):
+        (local_path / f"file{i}.txt").write_text(f"{MESSAGE} {i}")
+    committed.commit(local_path, message=MESSAGE, package=TEST_PKG)
+    source_udi = committed.get_udi(TEST_PKG)
+    for local in make_domain():
+        local.pull(source_udi)
+        pulled = local.package_path(TEST_PKG)
+        for file in pulled.iterdir():
+            os.utime(file, ns=(0, 0))
+        (pulled / "file1.txt").write_text(f"{MESSAGE} X")  # same size, new hash
+        (pulled / "file2.txt").write_text("changed")
+        local.pull(source_udi)
+        assert (pulled / "file0.txt").stat().st_mtime_ns == 0
+        assert (pulled / TEST_FILE).stat().st_mtime_ns == 0
+        for i in range(3):
+            assert (pulled / f"file{i}.txt").read_text() == f"{MESSAGE} {i}"
+        assert len(local.hash_cache) >= 2
+
+        local.pull(source_udi, relax={Tabular.K_INCREMENTAL: False})
+        assert (pulled / "file0.txt").stat().st_mtime_ns != 0
+
+
+def test_dom_pull_blobs(committed: Domain):
+    source_udi = committed.get_udi(TEST_PKG)
+    for local in make_domain():
+        assert local.blobs is not None
+        assert not local.blobs.dir.exists()  # created on first use
+
+        def blobs() -> list[Path]:
+            return [p for p in local.blobs.dir.rglob("*") if p.is_file()]
+
+        first = local.pull(source_udi)
+        second = local.pull(source_udi, local.store / "second")
+        readme, copy = first / TEST_FILE, second / TEST_FILE
+        assert copy.read_text() == MESSAGE
+        assert not os.path.samefile(readme, copy)  # no hardlinks by default
+        stored = blobs()
+        assert len(stored) == (1 if local.blobs.can_reflink() else 0)
+        readme.write_text("edited in place")
+        assert all(blob.read_text() == MESSAGE for blob in stored)
+
+        linked = local.pull(
+            source_udi, local.store / "third", relax={Tabular.K_LINK: ["hardlink"]}
+        )
+        assert len(blobs()) == 1
+        assert local.blobs.is_installed(blobs()[0].name, linked / TEST_FILE)
+        assert (linked / TEST_FILE).read_text() == MESSAGE
+
+
+def test_dom_hash_index(committed: Domain):
+    namespace = committed[TEST_PKG]
+    tags = namespace.tags()
+    assert committed.TAG_DEFAULT in tags
+    top_hash = tags[committed.TAG_DEFAULT]
+    assert namespace.hash_index.get(top_hash) == ""
+    assert namespace.read_hash_from_tag(top_hash[:8]) == top_hash
+
+    other = top_hash[:8] + ("1" if top_hash[8] == "0" else "0") * 56
+    namespace.hash_index.put(other)
+    with pytest.raises(ValueError):
+        namespace.read_hash_from_tag(top_hash[:8])
+    assert namespace.read_hash_from_tag(top_hash[:9]) == top_hash
+
+
+def test_dom_external_writers(committed: Domain):
+    namespace = committed[TEST_PKG]
+    top_hash = namespace.tags()[committed.TAG_DEFAULT]
+    assert namespace.hash_index.exists() and namespace.tag_index.exists()
+
+    external = "ab" * 32  # e.g., copied in by quilt3 or another host
+    source = next(p for p in namespace.manifests.rglob("*") if p.is_file())
+    (namespace.manifests / external).write_bytes(source.read_bytes())
+    assert namespace.hash_index.get(external) is None
+    assert namespace.read_hash_from_tag("abab") == external
+    namespace.hash_index.put("abab" + "0" * 60)
+    with pytest.raises(ValueError, match="Multiple"):
+        namespace.read_hash_from_tag("abab")
+
+    (namespace.path / "1799999999").write_text(external)
+    (namespace.path / committed.TAG_DEFAULT).write_text(external)
+    tags = namespace.tags()
+    assert tags["1799999999"] == external
+    assert tags[committed.TAG_DEFAULT] == external
+    assert top_hash in tags.values()
+
+
+@pytest.fixture
+def legacy():
+    """Copy of the example registry, written before indexes existed."""
+    with TemporaryDirectory() as tmpdirname:
+        copytree(LOCAL_VOL, tmpdirname, dirs_exist_ok=True)
+        yield Domain.FromLocalPath(Path(tmpdirname))
+
+
+def test_dom_legacy_index(legacy: Domain):
+    namespace = legacy[TEST_PKG]
+    tags = namespace.tags()
+    namespace.tag(TEST_HASH)
+    assert len(namespace.tags()) == len(tags) + 1
+    with pytest.raises(ValueError, match="Multiple"):
+        namespace.read_hash_from_tag("5")  # 5e3a..., 5ec6..., 5f1b...
+    assert namespace.read_hash_from_tag("5f1b") == TEST_HASH
+
+
+def test_dom_legacy_versions(legacy: Domain):
+    namespace = legacy[TEST_PKG]
+    timestamps = [tag for tag in namespace if tag.isdigit()]
+    new_tag = namespace.tag(TEST_HASH)
+    versions = namespace.versions()
+    assert len(versions) == len(timestamps) + 1
+    assert versions[0] == (new_tag, TEST_HASH)
+
+
+def test_dom_versions(committed: Domain):
+    namespace = committed[TEST_PKG]
+    latest = namespace.read_hash_from_tag(committed.TAG_DEFAULT)
+    versions = namespace.versions()
+    assert len(versions) == 1
+    tag, hash = versions[0]
+    assert hash == latest
+    assert namespace.versions(since=int(tag) + 1) == []
+    assert namespace.versions(until=tag) == versions
+
+    for i in range(3):
+        namespace.version_log.append(str(int(tag) + 10 * (i + 1)), f"hash{i}")
+    assert [h for _, h in namespace.versions(limit=2)] == ["hash2", "hash1"]
+    window = namespace.versions(since=int(tag) + 10, until=int(tag) + 20)
+    assert [h for _, h in window] == ["hash1", "hash0"]
+
+    namespace.version_log.path.unlink()
+    assert namespace.versions() == versions  # rebuilt from tag files
+
+    (namespace.path / "1799999999").write_text(latest)  # tagged by another client
+    assert namespace.versions(limit=1) == [("1799999999", latest)]
+    assert len(namespace.versions()) == 2
+    assert VersionLog(namespace.version_log.path)._lock is namespace.version_log._lock
+
+
+def test_dom_header_footer(committed: Domain):
+    namespace = committed[TEST_PKG]
+    man = namespace[committed.TAG_DEFAULT]
+    assert man.path.suffix == Tabular.EXT4
+    list4 = list(man.table().iter_dict4())
+    Tabular.WriteParquet(list4, man.path.with_name(man.name), header_in_footer=True)
+
+    footer = Manifest(man.name, namespace)
+    head = footer.header()
+    assert footer._table is None  # read from the footer alone
+    assert head.message == MESSAGE
+    assert head.user_meta == TEST_META
+    assert footer.table().head.meta == TEST_META
+    assert len(footer) == 2
+
+
+def test_dom_top_hash(domain: Domain):
+    local_path = domain.package_path(TEST_PKG)
+    for i in range(5):
+        (local_path / f"file{i}.txt").write_text(f"{MESSAGE} {i}")
+    builder = FolderBuilder(local_path, domain)
+    top_hash = builder.commit(MESSAGE, TEST_META)
+    assert top_hash == builder.cf.digest(builder.to_bytes())
+
+    for footer in [False, True]:
+        path = local_path.parent / f"top_hash_{footer}"
+        Tabular.WriteParquet(builder.list4(), path, header_in_footer=footer)
+        table = Table4(Tabular.ParquetPath(path))
+        assert table.top_hash() == top_hash
+
+
+def test_dom_top_hash_sorted(domain: Domain):
+    local_path = domain.package_path(TEST_PKG)
+    for name in ["c.txt", "z.txt", "a.txt", "y.txt", "B.txt"]:
+        (local_path / name).write_text(f"{MESSAGE} {name}")
+    builder = FolderBuilder(local_path, domain, **{Tabular.K_SORT: True})
+    top_hash = builder.commit(MESSAGE)
+    names = [dict4.name for dict4 in builder.body4 or []]
+    assert names == sorted(names)
+
+    path = local_path.parent / "top_hash_sorted"
+    Tabular.WriteParquet(builder.list4(), path, **{Tabular.K_SORT: True})
+    table = Table4(Tabular.ParquetPath(path))
+    assert table.names()[1:] == names
+    assert table.top_hash() == top_hash
@@ -0,0 +1,76 @@
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from pytest import fixture
+
+from quiltcore import HashCache
+
+HASH = bytes.fromhex("1220" + "ab" * 32)
+
+
+def make_file(dir: Path, name: str, text: str) -> Path:
+    path = dir / name
+    path.write_text(text)
+    os.utime(path, (1, 1))  # avoid racy (too recent) mtimes
+    return path
+
+
+@fixture
+def dir():
+    with TemporaryDirectory() as tmpdirname:
+        yield Path(tmpdirname)
+
+
+def test_cache_key(dir: Path):
+    path = make_file(dir, "a.txt", "a")
+    key = HashCache.StatKey(path)
+    assert key and str(path) in key
+    assert HashCache.StatKey(dir / "missing.txt") is None
+
+    path.write_text("changed")
+    assert HashCache.StatKey(path) is None  # racy
+    os.utime(path, (2, 2))
+    assert HashCache.StatKey(path) != key
+
+
+def test_cache_persist(dir: Path):
+    cache = HashCache(dir)
+    key = HashCache.StatKey(make_file(dir, "a.txt", "a"))
+    assert cache.get(key) is None
+    cache.put(key, HASH)
+    assert cache.get(key) == HASH
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert not cache.path.exists()
+    cache.save()
+    assert cache.path.exists()
+
+    reloaded = HashCache(dir)
+    assert len(reloaded) == 1
+    assert reloaded.get(key) == HASH
+
+
+def test_cache_evict(dir: Path):
+    cache = HashCache(dir, max_size=2)
+    cache.put("a", HASH)
+    cache.put("b", HASH)
+    assert cache.get("a") == HASH  # "b" is now least recently used
+    cache.put("c", HASH)
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == HASH
+    assert cache.get("c") == HASH
+
+
+def test_cache_digest(dir: Path):
+    cache = HashCache(dir)
+    path = make_file(dir, "a.txt", "a")
+    calls: list[Path] = []
+
+    def digest(p: Path) -> bytes:
+        calls.append(p)
+        return HASH
+
+    assert cache.digest(path, digest) == HASH
+    assert cache.digest(path, digest) == HASH
+    assert calls == [path]
@@ -104,6 +104,26 @@ def test_man_install(man: Manifest, domain: Domain):
     assert TEST_KEY in str(clone.path)
     # assert entry.path != clone.path
 
+    multihash, entry.multihash = entry.multihash, Codec().digest(b"other")
+    bad_dest = dest / "bad"
+    try:
+        with pytest.raises(ValueError):
+            entry.install(str(bad_dest))
+        assert not list(bad_dest.rglob("*.*"))  # neither the file nor its temp
+    finally:
+        entry.multihash = multihash
+
+
+def test_man_open(man: Manifest):
+    entry = man[TEST_KEY]
+    assert isinstance(entry, Entry)
+    with entry.open() as reader:
+        buffer = bytearray(entry.size)
+        assert reader.readinto(buffer) == entry.size
+        assert reader.verified  # without an extra read at EOF
+        assert reader.read() == b""
+    assert bytes(buffer) == entry.path.read_bytes()
+
 
 def test_man_hash(man: Manifest):
     hash = man.q3hash()
@@ -3,6 +3,10 @@ from upath import UPath
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+import json
+import jsonlines  # type: ignore
+import pyarrow as pa  # type: ignore
+
 
 from quiltcore import (
     Child,
@@ -19,6 +23,7 @@ from quiltcore import (
     Namespace,
     Node,
     Scheme,
+    Tabular,
     Types,
     quilt,
 )
@@ -218,3 +223,40 @@ def test_node_save_manifest():
         assert dest.head is not None
         assert dest.body is not None
         assert len(dest) == len(source)
+
+
+def test_node_encode_lines(node):
+    """Columnar JSONL encoding matches the per-row Dict3 encoding."""
+    child = Child("name", node)
+    rows = [
+        ("plain.txt", "/tmp/none/plain.txt", {}, {"mode": 1}),
+        ('say "hi"\t.txt', "/tmp/none/say hi é.txt", {"k": "v"}, {}),
+        ("ü/data.csv", "/tmp/none/ü/data.csv?versionId=abc", {"n": [1]}, {"a": 2}),
+    ]
+    list4 = [
+        Dict4.V2(
+            name=name,
+            place=place,
+            size=i,
+            multihash=f"1220{i:064x}",
+            info=info,
+            meta=meta,
+        )
+        for i, (name, place, meta, info) in enumerate(rows)
+    ]
+    body = Tabular.ListTable(list4, child.cf.json_default)
+    lines = child.cf.encode_lines(body).to_pylist()
+    for dict4, line in zip(list4, lines):
+        expected = child.dict4_to_dict3(dict4).to_dict()
+        if dict4.meta:
+            expected["meta"]["user_meta"] = dict4.meta
+        assert jsonlines.Reader([line]).read() == expected
+        assert line == json.dumps(expected, ensure_ascii=False) + "\n"
+
+    for key in ["size", "place", "multihash"]:
+        column = body.column(key)
+        nulls = pa.array([None] * len(column), column.type)
+        with pytest.raises(ValueError, match=key):
+            child.cf.encode_lines(
+                body.set_column(body.schema.get_field_index(key), key, nulls)
+            )
@@ -0,0 +1,59 @@
+import pytest
+
+from quiltcore import Budget, Pool
+
+
+def square(x: int) -> int:
+    return x * x
+
+
+def test_pool_serial():
+    pool = Pool()
+    assert pool.workers == 1
+    assert list(pool.map(square, range(5))) == [0, 1, 4, 9, 16]
+
+
+@pytest.mark.parametrize("executor", Pool.EXECUTORS.keys())
+def test_pool_ordered(executor: str):
+    pool = Pool(workers=4, queue=3, chunk=2, executor=executor)
+    assert executor in repr(pool)
+    assert list(pool.map(square, range(100))) == [x * x for x in range(100)]
+
+
+def test_pool_params():
+    params = {Pool.K_WORKERS: 0, Pool.K_QUEUE: 0, Pool.K_EXECUTOR: "thread"}
+    pool = Pool.FromParams(params)
+    assert pool.workers >= 1
+    assert pool.queue == 2 * pool.workers
+    assert pool.chunk == 1
+    with pytest.raises(ValueError):
+        Pool(executor="fiber")
+
+
+def test_pool_budget():
+    budget = Budget(10)
+    assert budget.acquire(4) == 4
+    budget.release(4)
+    assert budget.acquire(100) == 10  # clamped so it can run alone
+    assert budget.used == 10
+    budget.release(10)
+
+    unlimited = Budget()
+    assert unlimited.acquire(1 << 40) == 0
+    unlimited.release(0)
+
+
+def test_pool_budget_bounds():
+    budget = Budget(10)
+    peak = []
+
+    def work(size: int) -> int:
+        reserved = budget.acquire(size)
+        peak.append(budget.used)
+        budget.release(reserved)
+        return size
+
+    pool = Pool(workers=8)
+    assert list(pool.map(work, [3, 7, 20, 5] * 10)) == [3, 7, 20, 5] * 10
+    assert max(peak) <= 10
+    assert budget.used == 0
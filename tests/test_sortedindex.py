@@ -0,0 +1,53 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from pytest import fixture, raises
+
+from quiltcore import SortedIndex
+
+
+@fixture
+def index():
+    with TemporaryDirectory() as tmpdirname:
+        yield SortedIndex(Path(tmpdirname) / "sub" / "test.idx")
+
+
+def test_index_empty(index: SortedIndex):
+    assert not index.exists()
+    assert index.read() == []
+    assert index.get("a") is None
+    assert index.prefix("a") == []
+
+
+def test_index_put(index: SortedIndex):
+    for key in ["b2", "a1", "b1", "c"]:
+        index.put(key, key.upper())
+    index.put("b1", "new")
+    assert [key for key, _ in index.read()] == ["a1", "b1", "b2", "c"]
+    assert index.get("b1") == "new"
+    assert index.get("b") is None
+    assert index.prefix("b") == [("b1", "new"), ("b2", "B2")]
+    assert index.prefix("c") == [("c", "C")]
+    assert index.prefix("d") == []
+    files = sorted(p.name for p in index.path.parent.iterdir())
+    assert files in (["test.idx"], ["test.idx", "test.idx.lock"])  # no temp files
+
+    with raises(ValueError):
+        index.put("has space")
+
+
+def test_index_concurrent(index: SortedIndex):
+    def put(i: int) -> None:
+        SortedIndex(index.path).put(f"k{i:03}")  # a new instance per writer
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(put, range(100)))
+    assert len(index.read()) == 100
+
+
+def test_index_ensure(index: SortedIndex):
+    index.ensure(lambda: [("b", "B"), ("a", "A")])
+    assert index.read() == [("a", "A"), ("b", "B")]
+    index.ensure(lambda: [("c", "C")])  # already exists
+    assert index.get("c") is None
@@ -0,0 +1,60 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+
+from quiltcore import Domain, Manifest, TableCache, Tabular
+
+from .conftest import LOCAL_URI, TEST_HASH, TEST_PKG
+
+
+def fake_table(nbytes: int):
+    return SimpleNamespace(table=SimpleNamespace(nbytes=nbytes))
+
+
+def test_tc_lru():
+    cache = TableCache(max_bytes=100)
+    a, b, c = fake_table(40), fake_table(40), fake_table(40)
+    cache.put(("a", "/a"), a)
+    cache.put(("b", "/b"), b)
+    assert cache.get(("a", "/a")) is a  # now most recently used
+    cache.put(("c", "/c"), c)
+    assert ("b", "/b") not in cache
+    assert cache.nbytes == 80
+    assert cache.get(("b", "/b")) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.put(("huge", "/huge"), fake_table(101))
+    assert ("huge", "/huge") not in cache
+
+    cache.discard_path("/a")
+    assert len(cache) == 1 and cache.nbytes == 40
+    assert cache.get_or_load(("d", "/d"), lambda: a) is a
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0
+
+
+def test_tc_manifest():
+    shared = TableCache.Shared()
+    assert shared is TableCache.Shared()
+    namespace = Domain.FromURI(LOCAL_URI)[TEST_PKG]
+    first = Manifest(TEST_HASH, namespace)
+    table = first.table()
+    hits = shared.hits
+    second = Manifest(TEST_HASH, namespace)
+    assert second.table().table is table.table  # shares the parsed Arrow table
+    assert shared.hits == hits + 1
+
+    second.table().head.info["message"] = "changed"
+    second.table().parse_json()
+    third = Manifest(TEST_HASH, namespace).table()
+    assert third.head.info["message"] != "changed"
+    assert third.table is table.table
+    assert third.codec is not table.codec  # decoding options are per copy
+    assert third.names() == table.names()
+
+    lazy = Manifest(TEST_HASH, namespace, lazy_json=True).table()
+    assert lazy.lazy and not table.lazy
+
+    with TemporaryDirectory() as tmpdirname:
+        Tabular.WriteParquet(list(table.iter_dict4()), Path(tmpdirname) / "copy")
+    assert table.head.info["version"] == Tabular.HEADER_V3  # writers copy the head
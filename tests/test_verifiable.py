@@ -1,9 +1,10 @@
+from io import BytesIO
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
 from pytest import fixture, raises
 
-from quiltcore import Codec, Verifiable
+from quiltcore import Codec, Verifiable, VerifyingReader
 
 
 @fixture
@@ -68,3 +69,57 @@ def test_verify():
     assert verify.verify(b"") is False
     assert verify.verify(b"hash") is True
     assert verify.verify(b"hash2") is False
+
+
+def test_ver_stream(ver: Verifiable):
+    stream = BytesIO(Verify.TEST_BYTES * 1000)
+    assert ver.digest_stream(stream) == ver.digest_bytes(Verify.TEST_BYTES * 1000)
+    assert ver.cf.block_size() > 0
+
+    with TemporaryDirectory() as tmpdirname:
+        path = Path(tmpdirname) / "test.txt"
+        path.write_bytes(Verify.TEST_BYTES)
+        assert ver.digest_path(path) == Verify.HASH_BYTES
+        dict4 = ver.dict4_from_path(path)
+        assert dict4.multihash == Verify.HASH_BYTES
+        assert dict4.size == len(Verify.TEST_BYTES)
+
+        verify = Verify()
+        assert verify.verify(path) is True
+        assert verify.verify(BytesIO(b"hash")) is True
+        assert verify.verify(BytesIO(b"hash2")) is False
+
+
+def test_ver_reader():
+    codec = Codec()
+    reader = VerifyingReader(BytesIO(Verify.TEST_BYTES), codec, Verify.HASH_BYTES)
+    buffer = bytearray(3)
+    assert reader.readinto(buffer) == 3
+    assert buffer == Verify.TEST_BYTES[:3]
+    assert reader.read() == Verify.TEST_BYTES[3:]
+    assert reader.verified
+
+    with VerifyingReader(BytesIO(b"hash2"), codec, Verify.HASH_BYTES) as bad:
+        assert bad.read(4) == b"hash"
+        with raises(ValueError):
+            bad.read()
+
+    sized = VerifyingReader(BytesIO(Verify.TEST_BYTES), codec, Verify.HASH_BYTES, 4)
+    assert sized.read(4) == Verify.TEST_BYTES
+    assert sized.verified
+    with raises(ValueError):
+        VerifyingReader(BytesIO(b"hasx"), codec, Verify.HASH_BYTES, 4).read(4)
+    with raises(ValueError):
+        VerifyingReader(BytesIO(b"hash2"), codec, Verify.HASH_BYTES, 4).read(5)
+
+
+def test_ver_mmap(ver: Verifiable):
+    codec = ver.cf
+    with TemporaryDirectory() as tmpdirname:
+        for size in [0, 4, codec.block_size() * 2 + 1]:
+            path = Path(tmpdirname) / f"test{size}.bin"
+            path.write_bytes(b"x" * size)
+            with path.open("rb") as fi:
+                expected = codec.digest_stream(fi)
+            assert codec.digest_mmap(path) == expected
+            assert codec.digest_path(path) == expected